@@ -0,0 +1,108 @@
+import math
+import time
+
+EASINGS = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease_in_out": lambda t: 3 * t * t - 2 * t * t * t,
+    "pulse": lambda t: math.sin(math.pi * t),
+}
+
+
+def lerp(start, end, amount):
+    return start + (end - start) * amount
+
+
+class Animation:
+    def __init__(self, key, duration, step, easing, on_done, started_at):
+        self.key = key
+        self.duration = duration
+        self.step = step
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.on_done = on_done
+        self.started_at = started_at
+        self.cancelled = False
+        self.finished = False
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, (now - self.started_at) / self.duration)
+
+
+class Animator:
+    # One after()-driven frame loop for every running animation. Progress is
+    # time based, so a frame that is skipped to stay inside the frame budget
+    # only lowers the frame rate, never stretches the animation.
+    def __init__(self, widget, fps=30, frame_budget_ms=8, now=time.monotonic):
+        self.widget = widget
+        self.frame_ms = max(1, int(1000 / fps))
+        self.frame_budget = frame_budget_ms / 1000
+        self.now = now
+        self.animations = {}
+        self.job = None
+        self.frames = 0
+        self.steps = 0
+        self.deferred_steps = 0
+
+    def animate(self, key, duration_ms, step, easing="ease_out", on_done=None):
+        self.cancel(key)
+        animation = Animation(key, duration_ms / 1000, step, easing, on_done, self.now())
+        self.animations[key] = animation
+        if self.job is None:
+            self.job = self.widget.after(0, self.frame)
+        return animation
+
+    def cancel(self, key, finish=False):
+        animation = self.animations.pop(key, None)
+        if animation is None:
+            return
+        animation.cancelled = True
+        if finish:
+            self.complete(animation)
+        if not self.animations and self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def cancel_all(self, finish=False):
+        for key in list(self.animations):
+            self.cancel(key, finish)
+
+    def running(self, key):
+        return key in self.animations
+
+    def complete(self, animation):
+        animation.step(animation.easing(1.0))
+        animation.finished = True
+        if animation.on_done:
+            animation.on_done()
+
+    def frame(self):
+        self.job = None
+        self.frames += 1
+        frame_start = self.now()
+        # Round robin: stepped animations move to the back, and anything past
+        # the budget waits for the next frame
+        for key, animation in list(self.animations.items()):
+            if animation.cancelled:
+                continue
+            now = self.now()
+            if now - frame_start > self.frame_budget:
+                self.deferred_steps += 1
+                continue
+            progress = animation.progress(now)
+            if progress >= 1.0:
+                self.animations.pop(key, None)
+                self.complete(animation)
+            else:
+                animation.step(animation.easing(progress))
+                if not animation.cancelled:
+                    self.animations[key] = self.animations.pop(key)
+            self.steps += 1
+        if self.animations and self.job is None:
+            self.job = self.widget.after(self.frame_ms, self.frame)
+
+    def stats(self):
+        return {"frames": self.frames, "steps": self.steps, "deferred_steps": self.deferred_steps,
+                "running": len(self.animations)}
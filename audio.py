@@ -0,0 +1,137 @@
+import io
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import wave
+
+
+class Sound:
+    def __init__(self, key, data):
+        self.key = key
+        self.data = data
+        with wave.open(io.BytesIO(data)) as wav:
+            self.channels = wav.getnchannels()
+            self.sample_rate = wav.getframerate()
+            self.duration = wav.getnframes() / self.sample_rate
+
+
+class WinsoundBackend:
+    name = "winsound"
+
+    def __init__(self):
+        import winsound
+        self.winsound = winsound
+
+    def play(self, sound):
+        self.winsound.PlaySound(sound.data, self.winsound.SND_MEMORY)
+
+
+class PipeBackend:
+    # Streams the in-memory WAV to a command-line player reading stdin
+    # (aplay on ALSA systems, paplay/pw-play under PulseAudio/PipeWire).
+    COMMANDS = {"aplay": ["aplay", "-q", "-"], "pw-play": ["pw-play", "-"], "paplay": ["paplay"]}
+
+    def __init__(self, command):
+        self.name = command
+        self.args = self.COMMANDS[command]
+
+    def play(self, sound):
+        subprocess.run(self.args, input=sound.data, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+
+
+class NullBackend:
+    name = "null"
+
+    def __init__(self):
+        self.played = []
+
+    def play(self, sound):
+        self.played.append(sound.key)
+
+
+def default_backend():
+    if sys.platform == "win32":
+        return WinsoundBackend()
+    for command in PipeBackend.COMMANDS:
+        if shutil.which(command):
+            return PipeBackend(command)
+    return NullBackend()
+
+
+class AudioPlayer:
+    # Sounds are read once at startup and played one at a time by a single
+    # worker thread. A trigger for a sound that is already waiting in the
+    # queue is coalesced, and a full queue drops the new trigger. on_done is
+    # called with the key on the worker thread after each sound finishes.
+    def __init__(self, sounds, backend=None, max_queue=4, on_done=None):
+        self.backend = backend or default_backend()
+        self.on_done = on_done
+        self.sounds = {}
+        for key, filename in sounds.items():
+            self.load(key, filename)
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.worker = threading.Thread(target=self.run, name="audio", daemon=True)
+        self.worker.start()
+
+    def load(self, key, filename):
+        if not os.path.exists(filename):
+            return False
+        with open(filename, "rb") as f:
+            data = f.read()
+        try:
+            self.sounds[key] = Sound(key, data)
+        except (wave.Error, EOFError):
+            return False
+        return True
+
+    def play(self, key):
+        if key not in self.sounds:
+            return False
+        with self.lock:
+            if key in self.pending:
+                self.coalesced += 1
+                return False
+            try:
+                self.queue.put_nowait(key)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self.pending.add(key)
+        return True
+
+    def run(self):
+        while True:
+            key = self.queue.get()
+            if key is None:
+                break
+            with self.lock:
+                self.pending.discard(key)
+            try:
+                self.backend.play(self.sounds[key])
+                self.played += 1
+            except Exception:
+                self.errors += 1
+            if self.on_done:
+                self.on_done(key)
+
+    def close(self, timeout=1.0):
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self.worker.join(timeout)
+
+    def stats(self):
+        return {"backend": self.backend.name, "loaded": len(self.sounds), "played": self.played,
+                "coalesced": self.coalesced, "dropped": self.dropped, "errors": self.errors,
+                "queued": self.queue.qsize()}
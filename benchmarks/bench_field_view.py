@@ -0,0 +1,87 @@
+import argparse
+import os
+import random
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from field_view import FieldView
+
+
+# The field drawing as it was before FieldView: wipe and rebuild every update
+def draw_field_legacy(canvas, ball_on, play):
+    canvas.delete("all")
+    canvas.create_rectangle(0, 0, 300, 200, fill="green")
+    for i in range(0, 300, 30):
+        canvas.create_line(i, 0, i, 200, fill="white")
+    x_pos = (ball_on / 100) * 300
+    canvas.create_oval(x_pos-5, 95, x_pos+5, 105, fill="brown")
+    color = "red" if play["yards"] < 0 else "blue"
+    canvas.create_line(play["start"] * 3, 100, play["end"] * 3, 100, fill=color, width=3)
+
+
+def make_plays(count, seed):
+    rng = random.Random(seed)
+    ball_on = 50
+    plays = []
+    for _ in range(count):
+        yards = rng.randint(-10, 30)
+        end = max(1, min(99, ball_on - yards))
+        plays.append({"type": "rush", "yards": yards, "start": ball_on, "end": end})
+        ball_on = end if 1 < end < 99 else 50
+    return plays
+
+
+def run(canvas, plays, update):
+    # Mapped, so update_idletasks times the actual redraw and not just item bookkeeping
+    canvas.pack()
+    canvas.wait_visibility()
+    first_id = canvas.create_line(0, 0, 0, 0)
+    canvas.delete(first_id)
+    start = time.perf_counter()
+    for play in plays:
+        update(play)
+        canvas.update_idletasks()
+    elapsed = time.perf_counter() - start
+    last_id = canvas.create_line(0, 0, 0, 0)
+    canvas.delete(last_id)
+    return elapsed, last_id - first_id - 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare legacy and retained field canvas redraws")
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        sys.exit(f"{parser.prog} needs a display (e.g. run it under xvfb-run): {error}")
+    plays = make_plays(args.updates, args.seed)
+
+    canvas = tk.Canvas(root, width=300, height=200, bg="green")
+    legacy = run(canvas, plays, lambda play: draw_field_legacy(canvas, play["end"], play))
+    canvas.destroy()
+
+    canvas = tk.Canvas(root, width=300, height=200, bg="green")
+    view = FieldView(canvas)
+
+    def retained(play):
+        view.update(play["end"], max(0, play["end"] - 10))
+        view.show_gain(play)
+
+    retained_result = run(canvas, plays, retained)
+    canvas.destroy()
+    root.destroy()
+
+    for name, (elapsed, ids) in (("legacy", legacy), ("retained", retained_result)):
+        print(f"{name:>9}: {1e6 * elapsed / args.updates:8.1f} us/update, "
+              f"{ids} canvas item IDs allocated over {args.updates} updates")
+    print(f"  speedup: {legacy[0] / retained_result[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_state import GameState, PLAY_TYPES
+from season_store import SeasonStore
+
+
+def play_games(count, plays_per_game, seed):
+    rng = random.Random(seed)
+    teams = [f"Team {number}" for number in range(1, 17)]
+    for _ in range(count):
+        team1, team2 = rng.sample(teams, 2)
+        state = GameState(team1, team2)
+        state.kickoff(rng.randint(1, 2))
+        for _ in range(plays_per_game):
+            if rng.random() < 0.05:
+                state.add_penalty(rng.randint(1, 2), rng.choice((5, 10, 15)))
+            else:
+                state.process_play(rng.choice(PLAY_TYPES), rng.randint(-10, 30), turnover=rng.random() < 0.03)
+        yield state
+
+
+# The season kept the way a game keeps its plays before PlayLog: a dict
+# per play like last_play, a dict per score like game_log and a box score line
+def legacy_records(state):
+    records = []
+    for record, text in zip(map(state.plays.record, range(len(state.plays))), state.box_score):
+        records.append({"team": state.team_name(record["possession"]), "type": state.plays.play_types[record["play_type"]]
+                        if record["play_type"] >= 0 else None, "yards": record["yards"], "start": record["start"],
+                        "end": record["end"], "down": record["down"], "distance": record["distance"],
+                        "turnover": bool(record["turnover"]), "kind": record["kind"], "value": record["value"],
+                        "entry": text})
+    return records
+
+
+def legacy_team_stats(records):
+    totals = {}
+    for record in records:
+        team = totals.setdefault(record["team"], {"plays": 0, "total_yards": 0, "rush_yards": 0, "pass_yards": 0})
+        if record["type"] is not None:
+            team["plays"] += 1
+            team["total_yards"] += record["yards"]
+            if record["type"] == "rush":
+                team["rush_yards"] += record["yards"]
+            elif record["type"] == "pass":
+                team["pass_yards"] += record["yards"]
+    return totals
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory and stat recomputation: columnar store vs per-play dicts")
+    parser.add_argument("--games", type=int, default=400)
+    parser.add_argument("--plays", type=int, default=240, help="plays per game")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    states = list(play_games(args.games, args.plays, args.seed))
+    print(f"played {args.games} games in {time.perf_counter() - started:.1f} s")
+
+    def build_store():
+        store = SeasonStore()
+        for state in states:
+            store.add_game(state.team1_name, state.team2_name, state.plays)
+        return store
+
+    store, store_bytes = measure(build_store)
+    legacy, legacy_bytes = measure(lambda: [record for state in states for record in legacy_records(state)])
+    print(f"{len(store)} records")
+    print(f"  per-play dicts and strings: {legacy_bytes / 2 ** 20:8.2f} MiB  ({legacy_bytes / len(legacy):.0f} B/record)")
+    print(f"  SeasonStore columns:        {store.nbytes / 2 ** 20:8.2f} MiB  ({store.nbytes / len(store):.0f} B/record, "
+          f"{store_bytes / 2 ** 20:.2f} MiB allocated with spare capacity)")
+
+    expected, legacy_time = timed(lambda: legacy_team_stats(legacy), args.repeat)
+    totals, store_time = timed(store.team_stats, args.repeat)
+    for team, stats in expected.items():
+        assert all(totals[team][stat] == value for stat, value in stats.items()), team
+    print(f"  team stats, Python loop over dicts: {1000 * legacy_time:8.1f} ms")
+    print(f"  team stats, vectorized:             {1000 * store_time:8.1f} ms")
+    _, slice_time = timed(lambda: store[len(store) // 2:].team_stats(), args.repeat)
+    print(f"  team stats over the second half:    {1000 * slice_time:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tournament import Tournament
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event loop responsiveness with many running game clocks")
+    parser.add_argument("--games", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--probe-ms", type=int, default=10, help="interval of the latency probe callback")
+    parser.add_argument("--no-displays", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        sys.exit(f"{parser.prog} needs a display (e.g. run it under xvfb-run): {error}")
+    tournament = Tournament(root, displays=not args.no_displays)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for number in range(args.games):
+        tournament.add_game(f"Home {number + 1}", f"Away {number + 1}")
+    root.update()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    # Under a minute the clocks show tenths, so every game redraws ten times a second
+    for game in tournament.games:
+        game.state.set_clock(59)
+        game.state.start_clock()
+
+    lateness = []
+    deadline = time.perf_counter() + args.seconds
+
+    def probe(expected):
+        now = time.perf_counter()
+        lateness.append(now - expected)
+        if now < deadline:
+            root.after(args.probe_ms, probe, now + args.probe_ms / 1000)
+        else:
+            root.quit()
+
+    root.after(args.probe_ms, probe, time.perf_counter() + args.probe_ms / 1000)
+    root.mainloop()
+
+    renders = sum(game.view.renders for game in tournament.games)
+    configures = sum(game.view.configures for game in tournament.games)
+    timer_stats = tournament.timers.stats()
+    root.destroy()
+
+    print(f"{args.games} games with running clocks for {args.seconds:.0f} s")
+    if args.games:
+        print(f"  per-game memory: {allocated / args.games / 1024:.1f} KiB (Python allocations)")
+    print(f"  clock timers fired: {timer_stats['fired']}, mean lateness {timer_stats['mean_lateness_ms']:.2f} ms")
+    print(f"  field renders: {renders}, widget configures: {configures}")
+    print(f"  probe lateness: p50 {1000 * percentile(lateness, 0.5):.2f} ms, "
+          f"p99 {1000 * percentile(lateness, 0.99):.2f} ms, max {1000 * max(lateness):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
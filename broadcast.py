@@ -0,0 +1,106 @@
+import json
+import queue
+import socket
+import threading
+import time
+
+DISPLAY_HOST = "127.0.0.1"
+DISPLAY_PORT = 8765
+
+
+def display_state(state):
+    # Everything an audience display shows, as plain JSON values
+    return {
+        "team1_name": state.team1_name, "team1_score": state.team1_score, "team1_color": state.team1_color,
+        "team2_name": state.team2_name, "team2_score": state.team2_score, "team2_color": state.team2_color,
+        "clock": state.game_clock.display(), "play_clock": state.play_clock.display(),
+        "quarter": state.quarter, "down": state.down, "yards_to_go": state.yards_to_go,
+        "ball_on": state.format_yard_line(state.ball_on), "possession": state.possession,
+    }
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class Broadcaster:
+    # Publishes display state to any number of display clients over TCP as
+    # newline-delimited JSON. The Tk thread only diffs against the last
+    # published state and queues one encoded delta; a sender thread owns the
+    # client sockets, writes each delta to all of them, and greets a new
+    # client with the full current state.
+    def __init__(self, host=DISPLAY_HOST, port=DISPLAY_PORT, send_timeout=0.05):
+        self.send_timeout = send_timeout
+        self.last = {}
+        self.seq = 0
+        self.queue = queue.SimpleQueue()
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()
+        self.clients = []
+        self.published = 0
+        self.dropped_clients = 0
+        self.running = True
+        self.acceptor = threading.Thread(target=self.accept, name="display-accept", daemon=True)
+        self.sender = threading.Thread(target=self.send, name="display-send", daemon=True)
+        self.acceptor.start()
+        self.sender.start()
+
+    def publish(self, current):
+        delta = {key: value for key, value in current.items() if self.last.get(key) != value}
+        if not delta:
+            return False
+        self.last = dict(current)
+        self.seq += 1
+        self.published += 1
+        self.queue.put(("delta", self.seq, delta, time.time()))
+        return True
+
+    def accept(self):
+        while self.running:
+            try:
+                client, _ = self.server.accept()
+            except OSError:
+                break
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.settimeout(self.send_timeout)
+            self.queue.put(("client", client, None, None))
+
+    def send(self):
+        full = {}
+        seq = 0
+        while True:
+            kind, value, delta, sent_at = self.queue.get()
+            if kind == "close":
+                break
+            if kind == "client":
+                if self.write(value, encode({"seq": seq, "full": full, "t": time.time()})):
+                    self.clients.append(value)
+                continue
+            seq = value
+            full.update(delta)
+            data = encode({"seq": seq, "delta": delta, "t": sent_at})
+            self.clients = [client for client in self.clients if self.write(client, data)]
+        for client in self.clients:
+            client.close()
+        self.clients = []
+
+    def write(self, client, data):
+        # A display that cannot keep up is dropped; it reconnects and is
+        # sent the full state again
+        try:
+            client.sendall(data)
+            return True
+        except OSError:
+            client.close()
+            self.dropped_clients += 1
+            return False
+
+    def stats(self):
+        return {"address": "%s:%d" % self.address, "clients": len(self.clients),
+                "published": self.published, "seq": self.seq, "dropped_clients": self.dropped_clients}
+
+    def close(self):
+        self.running = False
+        self.server.close()
+        self.queue.put(("close", None, None, None))
+        self.sender.join(1.0)
@@ -0,0 +1,70 @@
+import queue
+import time
+import traceback
+
+
+class CommandQueue:
+    # The one way for background threads to touch the game: they submit a
+    # callable here and the Tk main loop runs it on its next poll, so
+    # GameState and the widgets are only ever used from one thread. Each
+    # poll drains until the queue is empty or the time budget is spent.
+    def __init__(self, widget, poll_ms=20, budget_ms=8, now=time.monotonic):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self.budget = budget_ms / 1000
+        self.now = now
+        self.queue = queue.SimpleQueue()
+        self.job = None
+        self.dispatched = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+
+    def submit(self, func, *args):
+        # Safe to call from any thread
+        self.queue.put((self.now(), func, args))
+
+    def wrap(self, func):
+        return lambda *args: self.submit(func, *args)
+
+    def start(self):
+        if self.job is None:
+            self.job = self.widget.after(self.poll_ms, self.poll)
+
+    def stop(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def depth(self):
+        return self.queue.qsize()
+
+    def poll(self):
+        self.job = None
+        self.drain()
+        self.start()
+
+    def drain(self):
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+        started = self.now()
+        while self.now() - started <= self.budget:
+            try:
+                submitted_at, func, args = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            lag = self.now() - submitted_at
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            self.dispatched += 1
+            try:
+                func(*args)
+            except Exception:
+                self.errors += 1
+                traceback.print_exc()
+
+    def stats(self):
+        mean_lag = self.total_lag / self.dispatched if self.dispatched else 0.0
+        return {"submitted": self.dispatched + self.depth(), "dispatched": self.dispatched, "errors": self.errors,
+                "depth": self.depth(), "max_depth": self.max_depth,
+                "mean_lag_ms": 1000 * mean_lag, "max_lag_ms": 1000 * self.max_lag}
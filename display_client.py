@@ -0,0 +1,140 @@
+import argparse
+import json
+import socket
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from broadcast import DISPLAY_HOST, DISPLAY_PORT
+from command_queue import CommandQueue
+
+RECONNECT_SECONDS = 1.0
+
+
+class DisplayClient:
+    # Standalone audience display for a scoreboard published by Broadcaster.
+    # A reader thread receives the JSON lines and hands each message to the
+    # Tk loop through a CommandQueue; only changed labels are reconfigured.
+    def __init__(self, root, host=DISPLAY_HOST, port=DISPLAY_PORT):
+        self.root = root
+        self.host = host
+        self.port = port
+        self.root.title("Electric Football Scoreboard - Display")
+        self.root.geometry("800x400")
+        self.root.configure(bg="#006E33")
+        self.state = {}
+        self.seq = None
+        self.messages = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.connected = False
+        self.running = True
+        self.commands = CommandQueue(self.root, poll_ms=10)
+        self.setup_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.reader = threading.Thread(target=self.read, name="display-read", daemon=True)
+        self.reader.start()
+        self.commands.start()
+
+    def setup_gui(self):
+        style = ttk.Style()
+        style.configure("Display.TFrame", background="#006E33")
+        frame = ttk.Frame(self.root, style="Display.TFrame")
+        frame.pack(expand=True)
+        label = {"background": "#006E33", "foreground": "white"}
+        self.clock_label = ttk.Label(frame, text="--:--", font=("Arial", 72), **label)
+        self.clock_label.pack(pady=10)
+        score_frame = ttk.Frame(frame, style="Display.TFrame")
+        score_frame.pack(pady=10)
+        self.team1_label = ttk.Label(score_frame, text="", font=("Arial", 48), **label)
+        self.team1_label.pack(side="left", padx=50)
+        self.team2_label = ttk.Label(score_frame, text="", font=("Arial", 48), **label)
+        self.team2_label.pack(side="right", padx=50)
+        self.situation_label = ttk.Label(frame, text="", font=("Arial", 24), **label)
+        self.situation_label.pack(pady=5)
+        self.field_label = ttk.Label(frame, text="Waiting for scoreboard...", font=("Arial", 36), **label)
+        self.field_label.pack(pady=10)
+
+    def read(self):
+        while self.running:
+            try:
+                with socket.create_connection((self.host, self.port), timeout=RECONNECT_SECONDS) as sock:
+                    sock.settimeout(None)
+                    self.commands.submit(self.set_connected, True)
+                    for line in sock.makefile("r", encoding="utf-8"):
+                        received_at = time.time()
+                        self.commands.submit(self.apply, json.loads(line), received_at)
+            except (OSError, ValueError):
+                pass
+            self.commands.submit(self.set_connected, False)
+            time.sleep(RECONNECT_SECONDS)
+
+    def set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if not connected:
+            self.field_label.config(text="Waiting for scoreboard...")
+
+    def apply(self, message, received_at):
+        if "full" in message:
+            self.state = dict(message["full"])
+            changed = set(self.state)
+        else:
+            self.state.update(message["delta"])
+            changed = set(message["delta"])
+        self.seq = message["seq"]
+        latency = max(0.0, received_at - message["t"])
+        self.messages += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.render(changed)
+
+    def render(self, changed):
+        state = self.state
+        if "clock" in changed:
+            self.clock_label.config(text=state["clock"])
+        for team in ("team1", "team2"):
+            label = self.team1_label if team == "team1" else self.team2_label
+            if changed & {f"{team}_name", f"{team}_score", "possession"}:
+                marker = " *" if state.get("possession") == (1 if team == "team1" else 2) else ""
+                label.config(text=f"{state.get(f'{team}_name', '')}: {state.get(f'{team}_score', 0)}{marker}")
+            if f"{team}_color" in changed:
+                label.config(foreground=state[f"{team}_color"])
+        if changed & {"quarter", "down", "yards_to_go", "play_clock"}:
+            self.situation_label.config(text=f"Q{state.get('quarter')}  |  {state.get('down')} & "
+                                             f"{state.get('yards_to_go')}  |  Play: {state.get('play_clock')}")
+        if "ball_on" in changed:
+            self.field_label.config(text=f"Ball on: {state['ball_on']}")
+
+    def stats(self):
+        return {"messages": self.messages, "seq": self.seq,
+                "mean_latency_ms": 1000 * self.total_latency / self.messages if self.messages else 0.0,
+                "max_latency_ms": 1000 * self.max_latency}
+
+    def close(self):
+        self.running = False
+        self.commands.stop()
+        self.root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audience display for a networked scoreboard")
+    parser.add_argument("--host", default=DISPLAY_HOST)
+    parser.add_argument("--port", type=int, default=DISPLAY_PORT)
+    parser.add_argument("--fullscreen", action="store_true")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    if args.fullscreen:
+        root.attributes("-fullscreen", True)
+    client = DisplayClient(root, args.host, args.port)
+    root.mainloop()
+    stats = client.stats()
+    print(f"{stats['messages']} updates, latency mean {stats['mean_latency_ms']:.1f} ms, "
+          f"max {stats['max_latency_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from game_state import SIMULATED_YARDS
+from play_log import PLAY
+from season_db import SEASON_DB, connect
+from simulator import DEFAULT_RULES
+
+EXPECTED_POINTS = "expected_points.npz"
+# States are (down, yards to go, yards to the goal); longer distances share
+# the last bucket
+MAX_DISTANCE = 30
+SHAPE = (4, MAX_DISTANCE, 99)
+TOUCHDOWN_POINTS = 6 + DEFAULT_RULES["pat_rate"]
+FIELD_GOAL_POINTS = 3
+# Gains the league's plays are blended with, as this many simulated plays
+PRIOR_PLAYS = 200
+# The cache is rebuilt at startup once the league has this many more plays
+REBUILD_GROWTH = 0.1
+# Kicks are not recorded play by play, so the advisor uses fixed kicking
+# numbers: make rate by kick length (line of scrimmage + 17) and net punt
+FIELD_GOAL_SNAP = 17
+FIELD_GOAL_CHANCE = ((20, 0.95), (40, 0.75), (55, 0.35), (60, 0.0))
+PUNT_NET_YARDS = 38
+TOUCHBACK_TO_GOAL = 80
+FOURTH_DOWN_OPTIONS = {"go": "Go for it", "field_goal": "Field goal", "punt": "Punt"}
+
+
+def clip(value, low, high):
+    return low if value < low else high if value > high else value
+
+
+def state_index(down, distance, to_goal):
+    return ((clip(down, 1, 4) - 1) * MAX_DISTANCE + clip(distance, 1, MAX_DISTANCE) - 1) * 99 + clip(to_goal, 1, 99) - 1
+
+
+def league_outcomes(db):
+    # (gains, probabilities, turnover rate, plays) from every recorded play,
+    # with the simulator's even spread of gains as a prior for a young league
+    rows = db.execute("SELECT yards, turnover, touchdown FROM plays WHERE yards IS NOT NULL").fetchall()
+    yards, turnovers, touchdowns = np.array(rows, dtype=np.int64).reshape(-1, 3).T
+    gains = np.arange(-99, 100)
+    counts = np.bincount(np.clip(yards, -99, 99) + 99, minlength=gains.size).astype(float)
+    low, high = SIMULATED_YARDS
+    counts[low + 99:high + 100] += PRIOR_PLAYS / (high - low + 1)
+    # A touchdown stands even when the play was also marked a turnover
+    live = yards.size - int(touchdowns.sum())
+    turnover_rate = int((turnovers * (1 - touchdowns)).sum()) / (live + PRIOR_PLAYS)
+    seen = counts > 0
+    return gains[seen], counts[seen] / counts.sum(), turnover_rate, int(yards.size)
+
+
+def transitions(gains):
+    # For every state and gain: the points scored outright, and the state the
+    # drive goes on in (with its sign: -1 when the other team has the ball)
+    # without and with a turnover
+    down, distance, to_goal = (axis.reshape(-1, 1) + 1 for axis in np.indices(SHAPE).reshape(3, -1))
+    gains = gains.reshape(1, -1)
+    left = to_goal - gains
+    touchdown = left <= 0
+    spot = np.clip(left, 1, 99)
+    first_down = distance - gains <= 0
+    on_downs = ~first_down & (down == 4)
+    first_down_state = 9 * 99 + spot - 1
+    other_team_state = 9 * 99 + 100 - spot - 1
+    next_down_state = ((np.minimum(down, 3) * MAX_DISTANCE + np.clip(distance - gains, 1, MAX_DISTANCE) - 1) * 99
+                       + spot - 1)
+    points = np.where(touchdown, TOUCHDOWN_POINTS, 0.0)
+    held = np.where(first_down, first_down_state, np.where(on_downs, other_team_state, next_down_state))
+    held_sign = np.where(touchdown, 0.0, np.where(on_downs, -1.0, 1.0))
+    lost_sign = np.where(touchdown, 0.0, -1.0)
+    return points, held, held_sign, other_team_state, lost_sign
+
+
+def solve(gains, probabilities, turnover_rate, tolerance=1e-9, max_sweeps=5000):
+    # Expected points of the next score for the team with the ball, by value
+    # iteration: a touchdown ends the chain, a turnover or a failed fourth
+    # down hands the other team the ball at the spot, worth minus their value
+    points, held, held_sign, lost, lost_sign = transitions(gains)
+    weights = probabilities.reshape(1, -1)
+    scored = (weights * points).sum(axis=1)
+    held_weight = weights * (1 - turnover_rate) * held_sign
+    lost_weight = weights * turnover_rate * lost_sign
+    values = np.zeros(int(np.prod(SHAPE)))
+    for sweep in range(1, max_sweeps + 1):
+        updated = scored + (held_weight * values[held]).sum(axis=1) + (lost_weight * values[lost]).sum(axis=1)
+        change = np.abs(updated - values).max()
+        values = updated
+        if change < tolerance:
+            break
+    return values, sweep
+
+
+def field_goal_chance(to_goal):
+    lengths, chances = zip(*FIELD_GOAL_CHANCE)
+    return float(np.interp(to_goal + FIELD_GOAL_SNAP, lengths, chances))
+
+
+class ExpectedPoints:
+    # The solved table, one float per (down, distance, yard line), and the
+    # play distribution it was solved from
+    def __init__(self, values, gains, probabilities, turnover_rate, plays):
+        self.values = np.asarray(values, dtype=float).reshape(-1)
+        self.table = self.values.tolist()
+        self.gains = gains
+        self.probabilities = probabilities
+        self.turnover_rate = turnover_rate
+        self.plays = plays
+
+    @classmethod
+    def build(cls, db):
+        gains, probabilities, turnover_rate, plays = league_outcomes(db)
+        values, _ = solve(gains, probabilities, turnover_rate)
+        return cls(values, gains, probabilities, turnover_rate, plays)
+
+    def save(self, path=EXPECTED_POINTS):
+        np.savez(path, values=self.values, gains=self.gains, probabilities=self.probabilities,
+                 turnover_rate=self.turnover_rate, plays=self.plays)
+
+    @classmethod
+    def load(cls, path=EXPECTED_POINTS):
+        with np.load(path) as data:
+            return cls(data["values"], data["gains"], data["probabilities"], float(data["turnover_rate"]),
+                       int(data["plays"]))
+
+    @classmethod
+    def load_or_build(cls, db, path=EXPECTED_POINTS):
+        # The cached table unless the league has grown past REBUILD_GROWTH
+        # since it was solved
+        plays = db.execute("SELECT COUNT(*) FROM plays WHERE yards IS NOT NULL").fetchone()[0]
+        if os.path.exists(path):
+            model = cls.load(path)
+            if plays <= model.plays * (1 + REBUILD_GROWTH):
+                return model
+        model = cls.build(db)
+        model.save(path)
+        return model
+
+    def ep(self, down, distance, to_goal):
+        return self.table[state_index(down, distance, to_goal)]
+
+    def play_epa(self, record):
+        # Expected points added by one PLAY record of a PlayLog
+        team, start, end = record["possession"], record["start"], record["end"]
+        down, distance, yards = record["down"], record["distance"], record["yards"]
+        if down < 1 or start < 0:
+            return None
+        before = self.ep(down, distance, start if team == 1 else 100 - start)
+        spot = end if team == 1 else 100 - end
+        if spot <= 0:
+            after = TOUCHDOWN_POINTS
+        elif record["turnover"] or (yards < distance and down >= 4):
+            after = -self.ep(1, 10, 100 - spot)
+        elif yards >= distance:
+            after = self.ep(1, 10, spot)
+        else:
+            after = self.ep(down + 1, distance - yards, spot)
+        return after - before
+
+    def fourth_down(self, distance, to_goal):
+        # Expected points of each fourth-down choice, best first
+        chance = field_goal_chance(to_goal)
+        turned_over = -self.ep(1, 10, 100 - to_goal)
+        punted = to_goal - PUNT_NET_YARDS
+        options = {
+            "go": self.ep(4, distance, to_goal),
+            "field_goal": chance * FIELD_GOAL_POINTS + (1 - chance) * turned_over,
+            "punt": -self.ep(1, 10, TOUCHBACK_TO_GOAL if punted <= 0 else 100 - punted),
+        }
+        return sorted(options.items(), key=lambda option: option[1], reverse=True)
+
+    def for_state(self, state):
+        to_goal = state.ball_on if state.possession == 1 else 100 - state.ball_on
+        return self.ep(state.down, state.yards_to_go, to_goal)
+
+
+class EPATracker:
+    # Expected points added by every play of the live game's PlayLog, kept
+    # per team. sync() scores only the records added since the last call;
+    # undo and redo change the log's tail, which is noticed by serial like
+    # Timeline does, and a cleared or loaded log starts over.
+    def __init__(self, state, model):
+        self.state = state
+        self.model = model
+        self.plays = None
+        self.keys = []
+        self.values = []
+        self.totals = {}
+
+    def reset(self):
+        self.plays = self.state.plays
+        self.keys, self.values = [], []
+        self.totals = {1: [0.0, 0], 2: [0.0, 0]}
+
+    def sync(self):
+        plays = self.state.plays
+        if plays is not self.plays:
+            self.reset()
+        while self.keys and (len(self.keys) > len(plays) or plays.key(len(self.keys) - 1) != self.keys[-1]):
+            self.keys.pop()
+            self.count(self.values.pop(), -1)
+        for index in range(len(self.keys), len(plays)):
+            value = None
+            if plays.columns["kind"][index] == PLAY:
+                record = plays.record(index)
+                epa = self.model.play_epa(record)
+                value = None if epa is None else (record["possession"], epa)
+            self.keys.append(plays.key(index))
+            self.values.append(value)
+            self.count(value, 1)
+        return self
+
+    def count(self, value, sign):
+        if value is not None:
+            total = self.totals[value[0]]
+            total[0] += sign * value[1]
+            total[1] += sign
+
+    def team(self, team):
+        # (total EPA, EPA per play) for team 1 or 2
+        self.sync()
+        total, plays = self.totals[team]
+        return total, total / plays if plays else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve the expected points table from the league's plays")
+    parser.add_argument("--db", default=SEASON_DB)
+    parser.add_argument("--out", default=EXPECTED_POINTS)
+    args = parser.parse_args()
+
+    db = connect(args.db)
+    started = time.perf_counter()
+    gains, probabilities, turnover_rate, plays = league_outcomes(db)
+    db.close()
+    values, sweeps = solve(gains, probabilities, turnover_rate)
+    elapsed = time.perf_counter() - started
+    model = ExpectedPoints(values, gains, probabilities, turnover_rate, plays)
+    model.save(args.out)
+    mean = float((gains * probabilities).sum())
+    print(f"{plays} league plays: {mean:.1f} yards a play, {100 * turnover_rate:.1f}% turnovers")
+    print(f"{values.size} states solved in {sweeps} sweeps, {elapsed:.2f} s -> {args.out}")
+    print("1st & 10 from " + ", ".join(f"{to_goal}: {model.ep(1, 10, to_goal):+.2f}" for to_goal in (95, 75, 50, 25, 5)))
+
+
+if __name__ == "__main__":
+    main()
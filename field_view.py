@@ -0,0 +1,59 @@
+GAIN_COLORS = {"rush": "blue", "pass": "purple"}
+
+
+class FieldView:
+    # Canvas items are created once; updates only move or restyle them so a
+    # redraw never allocates new item IDs.
+    def __init__(self, canvas, width=300, height=200, gain_ms=2000):
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.gain_ms = gain_ms
+        self.hide_job = None
+        mid = height / 2
+        canvas.create_rectangle(0, 0, width, height, fill="green", tags="field")
+        for i in range(0, width, width // 10):
+            canvas.create_line(i, 0, i, height, fill="white", tags="field")
+        self.scrimmage = canvas.create_line(0, 0, 0, height, fill="blue", width=2, dash=(4, 2))
+        self.first_down = canvas.create_line(0, 0, 0, height, fill="yellow", width=2)
+        self.gain = canvas.create_line(0, mid, 0, mid, width=3, state="hidden")
+        self.ball = canvas.create_oval(0, mid - 5, 10, mid + 5, fill="brown")
+        self.ball_x = None
+        self.first_down_x = None
+
+    def x(self, yard):
+        return (yard / 100) * self.width
+
+    def update(self, ball_on, line_to_gain=None):
+        ball_x = self.x(ball_on)
+        if ball_x != self.ball_x:
+            mid = self.height / 2
+            self.canvas.coords(self.ball, ball_x - 5, mid - 5, ball_x + 5, mid + 5)
+            self.canvas.coords(self.scrimmage, ball_x, 0, ball_x, self.height)
+            self.ball_x = ball_x
+        first_down_x = None if line_to_gain is None else self.x(line_to_gain)
+        if first_down_x != self.first_down_x:
+            if first_down_x is None:
+                self.canvas.itemconfigure(self.first_down, state="hidden")
+            else:
+                self.canvas.coords(self.first_down, first_down_x, 0, first_down_x, self.height)
+                self.canvas.itemconfigure(self.first_down, state="normal")
+            self.first_down_x = first_down_x
+
+    def show_gain(self, play):
+        if not play or play["yards"] is None:
+            return
+        color = "red" if play["yards"] < 0 else GAIN_COLORS.get(play["type"])
+        if color is None:
+            return
+        mid = self.height / 2
+        self.canvas.coords(self.gain, self.x(play["start"]), mid, self.x(play["end"]), mid)
+        self.canvas.itemconfigure(self.gain, fill=color, state="normal")
+        self.canvas.tag_raise(self.ball)
+        if self.hide_job:
+            self.canvas.after_cancel(self.hide_job)
+        self.hide_job = self.canvas.after(self.gain_ms, self.hide_gain)
+
+    def hide_gain(self):
+        self.hide_job = None
+        self.canvas.itemconfigure(self.gain, state="hidden")
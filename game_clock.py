@@ -0,0 +1,87 @@
+import math
+import time
+
+TENTHS_BELOW = 60
+
+
+def format_clock(remaining, tenths_below=TENTHS_BELOW):
+    if tenths_below and remaining < tenths_below:
+        tenths = int(remaining * 10 + 1e-6)
+        return f"{tenths // 10:02d}.{tenths % 10}"
+    seconds = math.ceil(remaining - 1e-6)
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class GameClock:
+    # Remaining time is always computed from a monotonic start timestamp, so
+    # however late the UI gets to poll, the clock itself never drifts.
+    def __init__(self, seconds=0, now=time.monotonic, tenths_below=TENTHS_BELOW):
+        self.now = now
+        self.tenths_below = tenths_below
+        self.running = False
+        self.started_at = None
+        self.remaining_at_start = float(seconds)
+        self.due_at = None
+        self.polls = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def set(self, seconds):
+        self.remaining_at_start = float(max(0, seconds))
+        if self.running:
+            self.started_at = self.now()
+
+    def start(self):
+        if not self.running and self.remaining_at_start > 0:
+            self.running = True
+            self.started_at = self.now()
+
+    def pause(self):
+        if self.running:
+            self.remaining_at_start = self.remaining()
+            self.running = False
+            self.started_at = None
+        self.due_at = None
+
+    def remaining(self):
+        if not self.running:
+            return self.remaining_at_start
+        return max(0.0, self.remaining_at_start - (self.now() - self.started_at))
+
+    def seconds(self):
+        return math.ceil(self.remaining() - 1e-6)
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def display(self):
+        return format_clock(self.remaining(), self.tenths_below)
+
+    def next_delay(self):
+        # Seconds until the displayed value next changes
+        remaining = self.remaining()
+        step = 0.1 if self.tenths_below and remaining <= self.tenths_below else 1.0
+        delay = remaining % step
+        return delay if delay > 1e-3 else step
+
+    def arm(self, delay):
+        self.due_at = self.now() + delay
+
+    def fired(self):
+        if self.due_at is None:
+            return
+        lateness = max(0.0, self.now() - self.due_at)
+        self.due_at = None
+        self.polls += 1
+        self.total_lateness += lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+
+    def drift_report(self):
+        # A clock that decremented once per callback would be behind by the
+        # sum of every callback's lateness; this one is not.
+        return {
+            "polls": self.polls,
+            "mean_lateness_ms": 1000 * self.total_lateness / self.polls if self.polls else 0.0,
+            "max_lateness_ms": 1000 * self.max_lateness,
+            "avoided_drift_s": self.total_lateness,
+        }
@@ -0,0 +1,575 @@
+import functools
+import time
+
+from game_clock import GameClock
+from play_log import (PlayLog, PLAY, KICKOFF, BALL_MOVED, POSSESSION, SCORE, PENALTY, NOTE,
+                      quarter_label)
+
+QUARTER_SECONDS = 900
+OVERTIME_SECONDS = 300
+PLAY_CLOCK_SECONDS = 30
+TIMEOUTS_PER_HALF = 3
+OVERTIME_TIMEOUTS = 1
+SCORE_TYPES = {6: "TD", 3: "FG", 1: "XP", 2: "2PT/Safety"}
+PLAY_TYPES = ("pass", "rush", "stop")
+SIMULATED_YARDS = (-10, 30)
+POSSESSION_REASONS = ("Turnover", "Touchdown", "Turnover on downs")
+# What Timeline reconstructs at any point of the log
+SCOREBOARD_FIELDS = ("team1_score", "team2_score", "team1_timeouts", "team2_timeouts", "quarter",
+                     "down", "yards_to_go", "ball_on", "possession")
+
+
+def new_play_log(opening=None):
+    return PlayLog(PLAY_TYPES, POSSESSION_REASONS, opening)
+
+
+def new_stats():
+    return {"first_downs": 0, "total_yards": 0, "pass_yards": 0, "rush_yards": 0, "penalties": 0}
+
+
+def format_time(seconds):
+    minutes = seconds // 60
+    secs = seconds % 60
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class BoxScore:
+    # The box score as display strings, formatted from the PlayLog records
+    # only when a line is actually read
+    def __init__(self, state):
+        self.state = state
+
+    def __len__(self):
+        return len(self.state.plays)
+
+    def __getitem__(self, index):
+        plays = self.state.plays
+        if isinstance(index, slice):
+            return [self.state.format_entry(row) for row in plays[index]]
+        return self.state.format_entry(plays[index])
+
+    def __iter__(self):
+        return (self.state.format_entry(row) for row in self.state.plays)
+
+
+def action(method):
+    # Marks a state-changing rule. A call from outside the engine (including
+    # from a listener) emits an "action" record before it runs and
+    # "action_done" after, so journals and history see every change once;
+    # rules calling rules stay internal.
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.action_depth:
+            return method(self, *args, **kwargs)
+        record = {"a": method.__name__, "p": list(args),
+                  "c": self.game_clock.remaining(),
+                  "t": round(self.action_time or time.time(), 3)}
+        if kwargs:
+            record["k"] = kwargs
+        self.emit("action", record=record)
+        self.action_depth += 1
+        previous_time, self.action_time = self.action_time, record["t"]
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.action_depth -= 1
+            self.action_time = previous_time
+            self.emit("action_done", record=record)
+    return wrapper
+
+
+class GameState:
+    # Rules engine with no tkinter dependency. Views subscribe to the events
+    # emitted by each rule and redraw only what the event names.
+    def __init__(self, team1_name="Team 1", team2_name="Team 2", now=time.monotonic):
+        self.listeners = []
+        self.action_depth = 0
+        self.action_time = None
+        self.history = None
+        # A replay turns this off and applies the recorded next_quarter instead
+        self.auto_advance = True
+        self.game_clock = GameClock(QUARTER_SECONDS, now)
+        self.play_clock = GameClock(PLAY_CLOCK_SECONDS, now, tenths_below=0)
+        self.shown_clock = None
+        self.shown_play_clock = None
+        self.team1_name = team1_name
+        self.team2_name = team2_name
+        self.team1_color = "#FF0000"
+        self.team2_color = "#0000FF"
+        self.overtime_enabled = False
+        self.quarter_seconds = QUARTER_SECONDS
+        self.reset(notify=False)
+
+    @action
+    def reset(self, notify=True):
+        self.team1_score = 0
+        self.team2_score = 0
+        self.seconds_remaining = self.quarter_seconds
+        self.clock_running = False
+        self.play_clock_seconds = PLAY_CLOCK_SECONDS
+        self.play_clock_running = False
+        self.quarter = 1
+        self.down = 1
+        self.yards_to_go = 10
+        self.ball_on = 35
+        self.plays = new_play_log()
+        self.game_log = []
+        self.team1_timeouts = TIMEOUTS_PER_HALF
+        self.team2_timeouts = TIMEOUTS_PER_HALF
+        self.possession = 1
+        self.team1_stats = new_stats()
+        self.team2_stats = new_stats()
+        self.weather = "Clear"
+        self.last_play = None
+        self.plays.opening = self.scoreboard()
+        if notify:
+            self.emit("reset")
+
+    # The clocks are monotonic GameClocks; these expose them as whole seconds
+    @property
+    def seconds_remaining(self):
+        return self.game_clock.seconds()
+
+    @seconds_remaining.setter
+    def seconds_remaining(self, seconds):
+        self.game_clock.set(seconds)
+
+    @property
+    def clock_running(self):
+        return self.game_clock.running
+
+    @clock_running.setter
+    def clock_running(self, running):
+        if running:
+            self.game_clock.start()
+        else:
+            self.game_clock.pause()
+
+    @property
+    def play_clock_seconds(self):
+        return self.play_clock.seconds()
+
+    @play_clock_seconds.setter
+    def play_clock_seconds(self, seconds):
+        self.play_clock.set(seconds)
+
+    @property
+    def play_clock_running(self):
+        return self.play_clock.running
+
+    @play_clock_running.setter
+    def play_clock_running(self, running):
+        if running:
+            self.play_clock.start()
+        else:
+            self.play_clock.pause()
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def emit(self, event, **data):
+        depth, self.action_depth = self.action_depth, 0
+        try:
+            for callback in list(self.listeners):
+                callback(event, data)
+        finally:
+            self.action_depth = depth
+
+    def replay(self, record):
+        self.game_clock.set(record["c"])
+        self.action_time = record["t"]
+        try:
+            getattr(self, record["a"])(*record["p"], **record.get("k", {}))
+        finally:
+            self.action_time = None
+
+    def team_name(self, team):
+        return self.team1_name if team == 1 else self.team2_name
+
+    def other_team(self, team):
+        return 2 if team == 1 else 1
+
+    def stats_for(self, team):
+        return self.team1_stats if team == 1 else self.team2_stats
+
+    def score_for(self, team):
+        return self.team1_score if team == 1 else self.team2_score
+
+    def timeouts_for(self, team):
+        return self.team1_timeouts if team == 1 else self.team2_timeouts
+
+    def format_yard_line(self, yard):
+        if yard == 50:
+            return "50"
+        elif yard < 50:
+            return f"{self.team2_name} {yard}"
+        else:
+            return f"{self.team1_name} {100 - yard}"
+
+    def scoreboard(self):
+        board = {field: getattr(self, field) for field in SCOREBOARD_FIELDS}
+        board["clock"] = self.seconds_remaining
+        board["team1_stats"] = dict(self.team1_stats)
+        board["team2_stats"] = dict(self.team2_stats)
+        return board
+
+    def stamp(self):
+        return f"Q{self.quarter} {format_time(self.seconds_remaining)}"
+
+    @property
+    def box_score(self):
+        return BoxScore(self)
+
+    def log(self, kind, **fields):
+        self.plays.append(kind, quarter=self.quarter, clock=self.seconds_remaining, possession=self.possession,
+                          team1_timeouts=self.team1_timeouts, team2_timeouts=self.team2_timeouts, **fields)
+        self.emit("log")
+
+    def format_entry(self, row):
+        (serial, kind, quarter, clock, possession, play_type, yards, start, end, down, distance,
+         turnover, team, value, reason) = row[:15]
+        plays = self.plays
+        if kind == NOTE:
+            return plays.notes.get(serial, "")
+        if kind == PLAY:
+            touchdown = end in (0, 100)
+            text = (f"{plays.play_types[play_type].capitalize()} Play: {yards} yds to "
+                    f"{'the end zone' if touchdown else self.format_yard_line(end)}"
+                    + (" (Turnover)" if turnover and not touchdown else ""))
+        elif kind == KICKOFF:
+            text = f"Kickoff: {self.team_name(team)} to {self.format_yard_line(end)}"
+        elif kind == BALL_MOVED:
+            text = f"Ball moved to {self.format_yard_line(end)}"
+        elif kind == POSSESSION:
+            text = f"{plays.reasons[reason]}: Possession to {self.team_name(team)}"
+        elif kind == SCORE:
+            text = f"{self.team_name(team)} {SCORE_TYPES.get(value, 'Score')} ({value} pts)"
+        else:
+            text = f"Penalty on {self.team_name(team)}: {value} yds"
+        return f"Q{quarter_label(quarter)} {format_time(clock)} - {text}"
+
+    # Field position: team 1 drives toward yard 0, team 2 toward yard 100.
+    def spot(self, team, own_yard_line):
+        return 100 - own_yard_line if team == 1 else own_yard_line
+
+    def move_ball(self, yards):
+        return self.ball_on - yards if self.possession == 1 else self.ball_on + yards
+
+    def line_to_gain(self):
+        return max(0, min(100, self.move_ball(self.yards_to_go)))
+
+    @action
+    def set_team_names(self, team1_name, team2_name):
+        self.team1_name = team1_name
+        self.team2_name = team2_name
+        self.emit("names")
+
+    @action
+    def set_team_color(self, team, color):
+        if team == 1:
+            self.team1_color = color
+        else:
+            self.team2_color = color
+        self.emit("colors", team=team)
+
+    @action
+    def set_weather(self, weather):
+        self.weather = weather
+        self.emit("weather")
+
+    @action
+    def set_overtime_enabled(self, enabled):
+        self.overtime_enabled = enabled
+        self.emit("overtime_enabled")
+
+    @action
+    def kickoff(self, kicking_team, kick_distance=65, return_yards=20):
+        receiving_team = self.other_team(kicking_team)
+        self.possession = receiving_team
+        self.down = 1
+        self.yards_to_go = 10
+        self.ball_on = self.spot(receiving_team, max(1, min(99, kick_distance - return_yards)))
+        self.last_play = None
+        self.emit("possession")
+        self.emit("downs")
+        self.emit("ball")
+        self.log(KICKOFF, team=kicking_team, end=self.ball_on)
+        self.reset_play_clock()
+        self.emit("kickoff", kicking_team=kicking_team)
+
+    @action
+    def set_ball_position(self, side, yard_line):
+        self.ball_on = self.spot(side, yard_line)
+        self.emit("ball")
+        self.log(BALL_MOVED, end=self.ball_on)
+
+    @action
+    def process_play(self, play_type, yards, turnover=False):
+        team = self.possession
+        start_pos = self.ball_on
+        down, distance = self.down, self.yards_to_go
+        new_pos = self.move_ball(yards)
+        touchdown = new_pos <= 0 or new_pos >= 100
+        self.ball_on = max(1, min(99, new_pos))
+        end_pos = 0 if touchdown and team == 1 else 100 if touchdown else self.ball_on
+
+        current_stats = self.stats_for(team)
+        current_stats["total_yards"] += yards
+        if play_type.lower() == "pass":
+            current_stats["pass_yards"] += yards
+        elif play_type.lower() == "rush":
+            current_stats["rush_yards"] += yards
+
+        self.last_play = {"type": play_type, "yards": yards, "start": start_pos, "end": end_pos}
+        self.log(PLAY, play_type=self.plays.code(self.plays.play_types, play_type.lower()), yards=yards,
+                 start=start_pos, end=end_pos, down=down, distance=distance, turnover=int(bool(turnover)))
+
+        if touchdown:
+            self.add_score(team, 6)
+            self.ball_on = self.spot(self.other_team(team), 35)
+            self.switch_possession("Touchdown")
+        elif turnover:
+            self.switch_possession()
+        else:
+            self.yards_to_go -= yards
+            if self.yards_to_go <= 0:
+                self.down = 1
+                self.yards_to_go = 10
+                current_stats["first_downs"] += 1
+            elif self.down == 4:
+                self.switch_possession("Turnover on downs")
+            else:
+                self.down += 1
+
+        self.emit("ball")
+        self.emit("downs")
+        self.emit("stats")
+        self.reset_play_clock()
+        self.emit("play", play=self.last_play, turnover=turnover, touchdown=touchdown)
+        if touchdown:
+            self.emit("touchdown", team=team)
+
+    @action
+    def switch_possession(self, reason="Turnover"):
+        self.possession = self.other_team(self.possession)
+        self.down = 1
+        self.yards_to_go = 10
+        self.emit("possession")
+        self.emit("downs")
+        self.log(POSSESSION, team=self.possession, end=self.ball_on,
+                 reason=self.plays.code(self.plays.reasons, reason))
+
+    @action
+    def add_score(self, team, points):
+        if team == 1:
+            self.team1_score += points
+        else:
+            self.team2_score += points
+        self.log(SCORE, team=team, value=points)
+        self.game_log.append({"time": self.action_time or time.time(), "team": team, "points": points,
+                              "quarter": self.quarter, "clock": format_time(self.seconds_remaining),
+                              "possession": self.possession, "ball_on": self.ball_on})
+        self.emit("score", team=team, points=points)
+
+    @action
+    def add_penalty(self, team, yards):
+        self.stats_for(team)["penalties"] += 1
+        self.ball_on = max(1, min(99, self.move_ball(-yards if team == self.possession else yards)))
+        self.emit("ball")
+        self.emit("stats")
+        self.log(PENALTY, team=team, value=yards, end=self.ball_on)
+        self.emit("penalty", team=team, yards=yards)
+
+    @action
+    def use_timeout(self, team):
+        if self.timeouts_for(team) <= 0:
+            return False
+        if team == 1:
+            self.team1_timeouts -= 1
+        else:
+            self.team2_timeouts -= 1
+        self.pause_clock()
+        self.emit("timeouts")
+        self.emit("timeout", team=team)
+        return True
+
+    @action
+    def set_timeouts(self, count):
+        self.team1_timeouts = count
+        self.team2_timeouts = count
+        self.emit("timeouts")
+
+    @action
+    def start_clock(self):
+        self.clock_running = True
+        self.emit("clock_state")
+
+    @action
+    def pause_clock(self):
+        self.clock_running = False
+        self.play_clock_running = False
+        self.emit("clock_state")
+
+    @action
+    def set_clock(self, seconds):
+        self.seconds_remaining = seconds
+        self.emit("clock")
+
+    @action
+    def set_quarter_time(self, minutes):
+        self.quarter_seconds = minutes * 60
+        self.set_clock(self.quarter_seconds)
+
+    def tick(self, seconds=1):
+        # Step the running clocks by game seconds, for replays and batch runs
+        if self.clock_running:
+            self.game_clock.set(self.game_clock.remaining() - seconds)
+        if self.play_clock_running:
+            self.play_clock.set(self.play_clock.remaining() - seconds)
+        self.poll_clocks()
+
+    def poll_clocks(self):
+        shown = self.game_clock.display()
+        if shown != self.shown_clock:
+            self.shown_clock = shown
+            self.emit("clock")
+        if self.clock_running and self.game_clock.expired():
+            self.clock_running = False
+            self.emit("clock_state")
+            if self.auto_advance:
+                self.next_quarter()
+        shown = self.play_clock.display()
+        if shown != self.shown_play_clock:
+            self.shown_play_clock = shown
+            self.emit("play_clock")
+        if self.play_clock_running and self.play_clock.expired():
+            self.play_clock_running = False
+            self.emit("play_clock_expired")
+
+    def next_clock_delay(self):
+        delays = [clock.next_delay() for clock in (self.game_clock, self.play_clock) if clock.running]
+        return min(delays) if delays else None
+
+    @action
+    def start_play_clock(self):
+        self.play_clock_seconds = PLAY_CLOCK_SECONDS
+        self.play_clock_running = True
+        self.emit("play_clock")
+        self.emit("clock_state")
+
+    @action
+    def reset_play_clock(self):
+        self.play_clock_seconds = PLAY_CLOCK_SECONDS
+        self.play_clock_running = False
+        self.emit("play_clock")
+
+    @action
+    def next_quarter(self):
+        if self.quarter != "OT" and self.quarter < 4:
+            self.quarter += 1
+            self.seconds_remaining = self.quarter_seconds
+            if self.quarter == 3:
+                self.set_timeouts(TIMEOUTS_PER_HALF)
+            self.emit("clock")
+            self.emit("quarter")
+            self.emit("quarter_start")
+        elif self.quarter != "OT" and self.overtime_enabled and self.team1_score == self.team2_score:
+            self.start_overtime()
+        else:
+            self.end_game()
+
+    @action
+    def start_overtime(self):
+        self.quarter = "OT"
+        self.seconds_remaining = OVERTIME_SECONDS
+        self.set_timeouts(OVERTIME_TIMEOUTS)
+        self.emit("clock")
+        self.emit("quarter")
+        self.emit("overtime")
+
+    def winner(self):
+        if self.team1_score > self.team2_score:
+            return 1
+        if self.team2_score > self.team1_score:
+            return 2
+        return None
+
+    @action
+    def end_game(self):
+        self.clock_running = False
+        self.play_clock_running = False
+        self.emit("game_over", winner=self.winner())
+
+    @action
+    def undo(self):
+        return self.history.undo() if self.history else None
+
+    @action
+    def redo(self):
+        return self.history.redo() if self.history else None
+
+    @action
+    def clear_log(self):
+        self.plays = new_play_log(self.scoreboard())
+        self.game_log = []
+        self.emit("log_clear")
+
+    def to_dict(self):
+        return {
+            "team1": {"name": self.team1_name, "score": self.team1_score, "color": self.team1_color,
+                      "timeouts": self.team1_timeouts, "stats": self.team1_stats},
+            "team2": {"name": self.team2_name, "score": self.team2_score, "color": self.team2_color,
+                      "timeouts": self.team2_timeouts, "stats": self.team2_stats},
+            "quarter": self.quarter,
+            "time": self.seconds_remaining,
+            "play_clock": self.play_clock_seconds,
+            "down": self.down,
+            "yards": self.yards_to_go,
+            "ball_on": self.ball_on,
+            "possession": self.possession,
+            "weather": self.weather,
+            "overtime": self.overtime_enabled,
+            "quarter_seconds": self.quarter_seconds,
+            "box_score": list(self.box_score),
+            "game_log": self.game_log,
+            "plays": self.plays.to_dict()
+        }
+
+    @action
+    def load_dict(self, data):
+        self.team1_name = data["team1"]["name"]
+        self.team1_score = data["team1"]["score"]
+        self.team1_color = data["team1"]["color"]
+        self.team1_timeouts = data["team1"]["timeouts"]
+        self.team1_stats = data["team1"]["stats"]
+        self.team2_name = data["team2"]["name"]
+        self.team2_score = data["team2"]["score"]
+        self.team2_color = data["team2"]["color"]
+        self.team2_timeouts = data["team2"]["timeouts"]
+        self.team2_stats = data["team2"]["stats"]
+        self.quarter = data["quarter"]
+        self.seconds_remaining = data["time"]
+        self.play_clock_seconds = data["play_clock"]
+        self.down = data["down"]
+        self.yards_to_go = data["yards"]
+        self.ball_on = data["ball_on"]
+        self.possession = data["possession"]
+        self.weather = data["weather"]
+        self.overtime_enabled = data["overtime"]
+        self.quarter_seconds = data.get("quarter_seconds", QUARTER_SECONDS)
+        self.game_log = data["game_log"]
+        if "plays" in data:
+            self.plays = PlayLog.from_dict(data["plays"])
+        else:
+            # Lines saved as text cannot be replayed; review shows the loaded scoreboard throughout
+            self.plays = PlayLog.from_text(data["box_score"])
+            self.plays.opening = self.scoreboard()
+        self.clock_running = False
+        self.play_clock_running = False
+        self.last_play = None
+        self.emit("load")
@@ -0,0 +1,242 @@
+from collections import deque
+
+from play_log import PlayLog
+
+SCALAR_FIELDS = (
+    "team1_name", "team2_name", "team1_color", "team2_color", "team1_score", "team2_score",
+    "team1_timeouts", "team2_timeouts", "quarter", "down", "yards_to_go", "ball_on",
+    "possession", "weather", "overtime_enabled", "quarter_seconds", "last_play",
+)
+LOG_FIELDS = ("plays", "game_log")
+# Clock controls are not undoable; rules that reset the clocks restore them too
+SKIPPED_ACTIONS = {"start_clock", "pause_clock", "start_play_clock", "reset_play_clock", "undo", "redo"}
+CLOCK_ACTIONS = {"set_clock", "set_quarter_time", "next_quarter", "start_overtime", "reset", "load_dict"}
+
+
+class Snapshot:
+    # The game's fixed-size part: a tuple of scalars (last_play is replaced,
+    # never mutated, so it is shared) plus copies of the two small stats
+    # dicts. The logs are not copied; see LogChange.
+    __slots__ = ("scalars", "team1_stats", "team2_stats", "clocks")
+
+    def __init__(self, state, clocks=False):
+        self.scalars = tuple(getattr(state, field) for field in SCALAR_FIELDS)
+        self.team1_stats = dict(state.team1_stats)
+        self.team2_stats = dict(state.team2_stats)
+        self.clocks = (state.game_clock.remaining(), state.play_clock.remaining()) if clocks else None
+
+    def restore(self, state):
+        for field, value in zip(SCALAR_FIELDS, self.scalars):
+            setattr(state, field, value)
+        state.team1_stats = dict(self.team1_stats)
+        state.team2_stats = dict(self.team2_stats)
+        if self.clocks:
+            state.pause_clock()
+            state.game_clock.set(self.clocks[0])
+            state.play_clock.set(self.clocks[1])
+
+    def to_dict(self):
+        return {"scalars": list(self.scalars), "team1_stats": self.team1_stats, "team2_stats": self.team2_stats,
+                "clocks": self.clocks}
+
+    @classmethod
+    def from_dict(cls, data):
+        snapshot = cls.__new__(cls)
+        snapshot.scalars = tuple(data["scalars"])
+        snapshot.team1_stats = data["team1_stats"]
+        snapshot.team2_stats = data["team2_stats"]
+        snapshot.clocks = data["clocks"]
+        return snapshot
+
+
+class LogChange:
+    # A log is shared with the live game and only its changed tail is kept:
+    # rules append in place and clear/load/reset swap in a new log. So a
+    # change is either "replace list" or "these entries were added from
+    # index start on".
+    __slots__ = ("field", "before", "after", "start", "added")
+
+    def __init__(self, field, mark, state):
+        self.field = field
+        before, length = mark
+        current = getattr(state, field)
+        self.before = self.after = None
+        if current is not before:
+            self.before, self.after = before, current
+            self.start, self.added = 0, ()
+            return
+        self.start = length
+        self.added = tuple(current[length:])
+
+    def empty(self):
+        return self.before is None and not self.added
+
+    def apply(self, state, undo):
+        if self.before is not None:
+            setattr(state, self.field, self.before if undo else self.after)
+            return
+        log = getattr(state, self.field)
+        if undo:
+            del log[self.start:]
+        else:
+            log.extend(self.added)
+
+    def to_dict(self, ref):
+        # ref gives a swapped log's position in History.to_dict's log list
+        if self.before is not None:
+            return {"field": self.field, "before": ref(self.before), "after": ref(self.after)}
+        return {"field": self.field, "start": self.start, "added": list(self.added)}
+
+    @classmethod
+    def from_dict(cls, data, logs):
+        change = cls.__new__(cls)
+        change.field = data["field"]
+        change.before = change.after = None
+        change.start, change.added = 0, ()
+        if "before" in data:
+            change.before, change.after = logs[data["before"]], logs[data["after"]]
+        else:
+            change.start = data["start"]
+            change.added = tuple(data["added"])
+        return change
+
+
+def mark(log):
+    return log, len(log)
+
+
+def dump_log(log):
+    # A log only History still refers to. Rows an undo deleted may come back
+    # with a redo, so their notes and serials are kept too
+    if isinstance(log, PlayLog):
+        return dict(log.to_dict(), notes={str(serial): text for serial, text in log.notes.items()},
+                    next_serial=log.next_serial)
+    return list(log)
+
+
+def load_log(data):
+    if not isinstance(data, dict):
+        return list(data)
+    log = PlayLog.from_dict(data)
+    log.next_serial = data["next_serial"]
+    return log
+
+
+class HistoryEntry:
+    __slots__ = ("name", "before", "after", "logs")
+
+    def __init__(self, name, before, after, logs):
+        self.name = name
+        self.before = before
+        self.after = after
+        self.logs = logs
+
+    def to_dict(self, ref):
+        return {"name": self.name, "before": self.before.to_dict(), "after": self.after.to_dict(),
+                "logs": [change.to_dict(ref) for change in self.logs]}
+
+    @classmethod
+    def from_dict(cls, data, logs):
+        return cls(data["name"], Snapshot.from_dict(data["before"]), Snapshot.from_dict(data["after"]),
+                   [LogChange.from_dict(change, logs) for change in data["logs"]])
+
+
+class History:
+    # Undo/redo over GameState actions in O(1) per step: each entry holds a
+    # fixed-size Snapshot from before and after the action plus the log tail
+    # it changed, so memory grows with what changed, not with the game.
+    # Listener-triggered actions nested inside another (a PAT chosen during a
+    # touchdown) are folded into the outer entry.
+    def __init__(self, state, limit=500):
+        self.state = state
+        self.limit = limit
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = []
+        self.depth = 0
+        self.pending = None
+        state.history = self
+        state.subscribe(self.on_state_event)
+
+    def on_state_event(self, event, data):
+        if event == "action":
+            self.depth += 1
+            name = data["record"]["a"]
+            if self.depth == 1 and name not in SKIPPED_ACTIONS:
+                clocks = name in CLOCK_ACTIONS
+                self.pending = (name, clocks, Snapshot(self.state, clocks),
+                                [mark(getattr(self.state, field)) for field in LOG_FIELDS])
+        elif event == "action_done":
+            self.depth -= 1
+            if self.depth == 0 and self.pending:
+                self.commit()
+
+    def commit(self):
+        name, clocks, before, marks = self.pending
+        self.pending = None
+        logs = [LogChange(field, log_mark, self.state) for field, log_mark in zip(LOG_FIELDS, marks)]
+        logs = [change for change in logs if not change.empty()]
+        self.undo_stack.append(HistoryEntry(name, before, Snapshot(self.state, clocks), logs))
+        self.redo_stack.clear()
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def to_dict(self):
+        # Both stacks as plain data, for the journal's snapshot. Logs an
+        # entry swaps in or out are referred to by position: the live ones
+        # first (the snapshot's state holds those), then every other log once
+        logs = [getattr(self.state, field) for field in LOG_FIELDS]
+        positions = {id(log): index for index, log in enumerate(logs)}
+
+        def ref(log):
+            if id(log) not in positions:
+                positions[id(log)] = len(logs)
+                logs.append(log)
+            return positions[id(log)]
+
+        undo = [entry.to_dict(ref) for entry in self.undo_stack]
+        redo = [entry.to_dict(ref) for entry in self.redo_stack]
+        plays = self.state.plays
+        return {"undo": undo, "redo": redo, "logs": [dump_log(log) for log in logs[len(LOG_FIELDS):]],
+                "notes": {str(serial): text for serial, text in plays.notes.items()},
+                "next_serial": plays.next_serial}
+
+    def load_dict(self, data):
+        # Stacks from to_dict, for a state already loaded from the same snapshot
+        plays = self.state.plays
+        plays.notes.update((int(serial), text) for serial, text in data["notes"].items())
+        plays.next_serial = max(plays.next_serial, data["next_serial"])
+        logs = [getattr(self.state, field) for field in LOG_FIELDS] + [load_log(log) for log in data["logs"]]
+        self.undo_stack = deque((HistoryEntry.from_dict(entry, logs) for entry in data["undo"]), maxlen=self.limit)
+        self.redo_stack = [HistoryEntry.from_dict(entry, logs) for entry in data["redo"]]
+        self.depth = 0
+        self.pending = None
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo(self):
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        for change in reversed(entry.logs):
+            change.apply(self.state, undo=True)
+        entry.before.restore(self.state)
+        self.redo_stack.append(entry)
+        self.state.emit("restore", name=entry.name, undo=True)
+        return entry.name
+
+    def redo(self):
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        for change in entry.logs:
+            change.apply(self.state, undo=False)
+        entry.after.restore(self.state)
+        self.undo_stack.append(entry)
+        self.state.emit("restore", name=entry.name, undo=False)
+        return entry.name
@@ -0,0 +1,305 @@
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from play_log import PLAY, SCORE, PENALTY, NOTE, PlayLog
+from season_db import (SEASON_DB, connect, field_zone, new_game, quarter_number, save_game,
+                       yards_to_goal)
+
+BATCH_SIZE = 500
+STAT_KEYS = ("first_downs", "total_yards", "pass_yards", "rush_yards", "penalties")
+ENTRY = re.compile(r"Q(\d+|OT) (\d+):(\d+) - (.*)")
+PLAY_RE = re.compile(r"(\w+) Play: (-?\d+) yds to (.+?)( \(Turnover\))?$")
+SCORE_RE = re.compile(r"(.+) \S+ \((\d+) pts\)$")
+PENALTY_RE = re.compile(r"Penalty on (.+): (\d+) yds$")
+KICKOFF_RE = re.compile(r"Kickoff: (.+) to (.+)$")
+BALL_MOVED_RE = re.compile(r"Ball moved to (.+)$")
+POSSESSION_RE = re.compile(r".+: Possession to (.+)$")
+
+known_hashes = frozenset()
+
+
+def find_files(directory):
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.endswith(".json"):
+                yield os.path.join(root, name)
+
+
+def validate(data):
+    if not isinstance(data, dict):
+        raise ValueError("not a JSON object")
+    for team in ("team1", "team2"):
+        info = data.get(team)
+        if not isinstance(info, dict) or not isinstance(info.get("name"), str):
+            raise ValueError(f"missing {team} name")
+        if not isinstance(info.get("score"), int):
+            raise ValueError(f"missing {team} score")
+        stats = info.get("stats")
+        if not isinstance(stats, dict) or not all(isinstance(stats.get(key), int) for key in STAT_KEYS):
+            raise ValueError(f"bad {team} stats")
+    if not isinstance(data.get("box_score"), list) or not all(isinstance(e, str) for e in data["box_score"]):
+        raise ValueError("bad box_score")
+    if not isinstance(data.get("game_log", []), list):
+        raise ValueError("bad game_log")
+    if not isinstance(data.get("season_game"), (int, type(None))):
+        raise ValueError("bad season_game")
+    if data["team1"]["name"] == data["team2"]["name"]:
+        raise ValueError("both teams have the same name")
+    if "plays" in data:
+        columns = data["plays"].get("columns") if isinstance(data["plays"], dict) else None
+        if not isinstance(columns, dict) or len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("bad plays")
+
+
+class BoxScoreReader:
+    # Rebuilds structured rows from the box score text that save_game has
+    # always written. Possession, down and distance are not in the text, so
+    # they are tracked the way the engine applies plays.
+    def __init__(self, team1, team2):
+        self.names = {team1: 1, team2: 2}
+        self.team1 = team1
+        self.team2 = team2
+        self.possession = 1
+        self.down = 1
+        self.yards_to_go = 10
+        self.ball_on = 35
+        self.seq = 0
+        self.plays = []
+        self.scores = []
+        self.penalties = []
+        self.unparsed = 0
+
+    def team_name(self, team):
+        return self.team1 if team == 1 else self.team2
+
+    def parse_spot(self, text):
+        if text == "50":
+            return 50
+        for name, team in self.names.items():
+            if text.startswith(name + " ") and text[len(name) + 1:].isdigit():
+                yard = int(text[len(name) + 1:])
+                return yard if team == 2 else 100 - yard
+        return None
+
+    def set_possession(self, team):
+        self.possession = team
+        self.down = 1
+        self.yards_to_go = 10
+
+    def read(self, entries):
+        for entry in entries:
+            match = ENTRY.match(entry)
+            if not match:
+                self.unparsed += 1
+                continue
+            quarter = quarter_number("OT" if match.group(1) == "OT" else int(match.group(1)))
+            clock = int(match.group(2)) * 60 + int(match.group(3))
+            self.seq += 1
+            if not self.read_text(match.group(4), quarter, clock):
+                self.unparsed += 1
+
+    def read_text(self, text, quarter, clock):
+        match = PLAY_RE.match(text)
+        if match:
+            play_type, yards, spot, turnover = match.groups()
+            yards = int(yards)
+            to_goal = yards_to_goal(self.possession, self.ball_on)
+            touchdown = spot == "the end zone" or yards >= to_goal
+            self.plays.append((self.seq, self.team_name(self.possession), quarter, clock, self.down,
+                               self.yards_to_go, self.ball_on, to_goal, field_zone(to_goal),
+                               play_type.lower(), yards, int(bool(turnover)), int(touchdown)))
+            end = self.parse_spot(spot)
+            if end is not None:
+                self.ball_on = end
+            if touchdown or turnover:
+                return True
+            self.yards_to_go -= yards
+            if self.yards_to_go <= 0:
+                self.down, self.yards_to_go = 1, 10
+            elif self.down < 4:
+                self.down += 1
+            return True
+        match = POSSESSION_RE.match(text)
+        if match and match.group(1) in self.names:
+            self.set_possession(self.names[match.group(1)])
+            return True
+        match = KICKOFF_RE.match(text)
+        if match and match.group(1) in self.names:
+            self.set_possession(3 - self.names[match.group(1)])
+            self.ball_on = self.parse_spot(match.group(2)) or self.ball_on
+            return True
+        match = PENALTY_RE.match(text)
+        if match and match.group(1) in self.names:
+            self.penalties.append((self.seq, match.group(1), int(match.group(2)), quarter, clock))
+            return True
+        match = BALL_MOVED_RE.match(text)
+        if match and self.parse_spot(match.group(1)) is not None:
+            self.ball_on = self.parse_spot(match.group(1))
+            return True
+        match = SCORE_RE.match(text)
+        if match and match.group(1) in self.names:
+            self.scores.append((self.seq, match.group(1), int(match.group(2)), quarter, clock))
+            return True
+        return False
+
+
+def read_play_log(plays, team1, team2):
+    # Saves written since the log became structured carry the records
+    # themselves, so nothing has to be parsed back out of the text
+    names = {1: team1, 2: team2}
+    rows = {"plays": [], "scores": [], "penalties": []}
+    unparsed = 0
+    for seq, record in enumerate(map(plays.record, range(len(plays))), 1):
+        kind, quarter, clock = record["kind"], record["quarter"], record["clock"]
+        if kind == PLAY:
+            team = record["possession"]
+            to_goal = yards_to_goal(team, record["start"])
+            touchdown = record["end"] in (0, 100)
+            rows["plays"].append((seq, names[team], quarter, clock, record["down"], record["distance"],
+                                  record["start"], to_goal, field_zone(to_goal),
+                                  plays.play_types[record["play_type"]], record["yards"],
+                                  int(record["turnover"] and not touchdown), int(touchdown)))
+        elif kind == SCORE:
+            rows["scores"].append((seq, names[record["team"]], record["value"], quarter, clock))
+        elif kind == PENALTY:
+            rows["penalties"].append((seq, names[record["team"]], record["value"], quarter, clock))
+        elif kind == NOTE:
+            unparsed += 1
+    return rows, unparsed
+
+
+def parse_clock(text):
+    minutes, _, seconds = str(text).partition(":")
+    return int(minutes) * 60 + int(seconds) if seconds else None
+
+
+def game_from_save(data, source_hash, fallback_time):
+    validate(data)
+    team1, team2 = data["team1"]["name"], data["team2"]["name"]
+    game_log = [score for score in data.get("game_log", []) if isinstance(score, dict)]
+    played_at = game_log[0].get("time", fallback_time) if game_log else fallback_time
+    season = datetime.date.fromtimestamp(played_at).year
+    game = new_game(season, team1, team2, played_at)
+    if "plays" in data:
+        rows, unparsed = read_play_log(PlayLog.from_dict(data["plays"]), team1, team2)
+    else:
+        reader = BoxScoreReader(team1, team2)
+        reader.read(data["box_score"])
+        rows = {"plays": reader.plays, "scores": reader.scores, "penalties": reader.penalties}
+        unparsed = reader.unparsed
+    game["plays"] = rows["plays"]
+    game["penalties"] = rows["penalties"]
+    if game_log:
+        # The structured score log is more reliable than the text
+        game["scores"] = [(seq, team1 if score["team"] == 1 else team2, score["points"],
+                           quarter_number(score["quarter"]), parse_clock(score.get("clock", "")))
+                          for seq, score in enumerate(game_log, 1)]
+    else:
+        game["scores"] = rows["scores"]
+    game["team1_score"], game["team2_score"] = data["team1"]["score"], data["team2"]["score"]
+    game["stats"] = {1: data["team1"]["stats"], 2: data["team2"]["stats"]}
+    game["status"] = "final"
+    game["source_hash"] = source_hash
+    # The games row the app recorded this game into, for saves made live
+    game["season_game"] = data.get("season_game")
+    return game, unparsed
+
+
+def init_worker(hashes):
+    global known_hashes
+    known_hashes = hashes
+
+
+def load_file(path):
+    # Runs in a worker process. Returns (path, status, game, detail).
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+        source_hash = hashlib.sha256(content).hexdigest()
+        if source_hash in known_hashes:
+            return path, "skipped", None, source_hash
+        data = json.loads(content)
+        game, unparsed = game_from_save(data, source_hash, os.path.getmtime(path))
+        return path, "ok", game, unparsed
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        return path, "failed", None, str(error)
+
+
+def recorded_live(db, game):
+    # A save of a game the app was recording already has its row; importing
+    # it again would count the game twice
+    if game["season_game"] is None:
+        return False
+    row = db.execute("SELECT team1, team2 FROM games WHERE id = ?", (game["season_game"],)).fetchone()
+    return row == (game["team1"], game["team2"])
+
+
+def import_directory(db, directory, workers=None, batch_size=BATCH_SIZE, verbose=False):
+    hashes = frozenset(row[0] for row in db.execute("SELECT source_hash FROM games WHERE source_hash IS NOT NULL"))
+    paths = list(find_files(directory))
+    counts = {"found": len(paths), "imported": 0, "skipped": 0, "recorded": 0, "duplicates": 0, "failed": 0,
+              "unparsed_lines": 0}
+    seen = set()
+    batch = []
+
+    def write_batch():
+        with db:
+            for game in batch:
+                save_game(db, game)
+        counts["imported"] += len(batch)
+        batch.clear()
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(hashes,)) as pool:
+        for path, status, game, detail in pool.map(load_file, paths, chunksize=chunksize):
+            if status == "skipped":
+                counts["skipped"] += 1
+            elif status == "failed":
+                counts["failed"] += 1
+                if verbose:
+                    print(f"{path}: {detail}")
+            elif game["source_hash"] in seen:
+                # The same file saved twice under different names
+                counts["duplicates"] += 1
+            elif recorded_live(db, game):
+                counts["recorded"] += 1
+            else:
+                seen.add(game["source_hash"])
+                counts["unparsed_lines"] += detail
+                batch.append(game)
+                if len(batch) >= batch_size:
+                    write_batch()
+    if batch:
+        write_batch()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import saved game JSON files into the season database")
+    parser.add_argument("directory")
+    parser.add_argument("--db", default=SEASON_DB)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("-v", "--verbose", action="store_true", help="list files that failed validation")
+    args = parser.parse_args()
+
+    db = connect(args.db)
+    started = time.perf_counter()
+    counts = import_directory(db, args.directory, args.workers, args.batch_size, args.verbose)
+    elapsed = time.perf_counter() - started
+    db.close()
+    print(f"{counts['found']} files: {counts['imported']} imported, {counts['skipped']} already imported, "
+          f"{counts['recorded']} recorded live, {counts['duplicates']} duplicates, {counts['failed']} failed")
+    print(f"{counts['imported'] / elapsed:.0f} games/s ({elapsed:.2f} s), "
+          f"{counts['unparsed_lines']} box score lines not recognised")
+
+
+if __name__ == "__main__":
+    main()
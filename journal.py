@@ -0,0 +1,155 @@
+import json
+import os
+import time
+
+JOURNAL_FILE = "journal.jsonl"
+SNAPSHOT_FILE = "snapshot.json"
+
+
+def dump(record):
+    return json.dumps(record, separators=(",", ":"))
+
+
+class Journal:
+    # Write-ahead log of GameState action records. Every record is flushed to
+    # the OS as it is written (enough to survive an app crash); fsync, which
+    # makes it survive power loss, is batched to once per sync_interval.
+    # Once snapshot_every records have built up, maintain() snapshots the
+    # state and truncates the journal, so recovery replays only the tail.
+    # The snapshot carries the undo history too, so undo and redo records
+    # replay like any other.
+    def __init__(self, directory, sync_interval=1.0, snapshot_every=250):
+        self.directory = directory
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        self.state = None
+        self.file = None
+        self.seq = 0
+        self.since_snapshot = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.syncs = 0
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or (
+            os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > 0)
+
+    def attach(self, state):
+        self.state = state
+        state.subscribe(self.on_state_event)
+
+    def on_state_event(self, event, data):
+        if event == "action":
+            self.append(data["record"])
+
+    def open(self):
+        if self.file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.file = open(self.journal_path, "a", encoding="utf-8")
+
+    def start(self, state):
+        # Begin a fresh journal for a new game
+        self.seq = 0
+        self.write_snapshot(state)
+        self.attach(state)
+
+    def append(self, record):
+        self.open()
+        self.seq += 1
+        record = dict(record, s=self.seq)
+        self.file.write(dump(record) + "\n")
+        self.file.flush()
+        self.unsynced += 1
+        self.since_snapshot += 1
+        if time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        if self.file is not None and self.unsynced:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.unsynced = 0
+            self.syncs += 1
+        self.last_sync = time.monotonic()
+
+    def maintain(self):
+        # Called between actions (records are written before their action
+        # runs, so snapshotting from append() would miss the last one)
+        self.sync()
+        if self.since_snapshot >= self.snapshot_every and self.state is not None:
+            self.write_snapshot(self.state)
+
+    def write_snapshot(self, state):
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {"s": self.seq, "clock": state.game_clock.remaining(),
+                    "play_clock": state.play_clock.remaining(), "state": state.to_dict(),
+                    "history": state.history.to_dict() if state.history else None}
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(dump(snapshot))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        # Records up to self.seq are now in the snapshot; a crash before the
+        # truncate below is harmless because recovery skips them by sequence.
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        with open(self.journal_path, "w", encoding="utf-8") as f:
+            os.fsync(f.fileno())
+        self.since_snapshot = 0
+        self.unsynced = 0
+
+    def read(self):
+        snapshot = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        records = []
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-write
+                        break
+        return snapshot, records
+
+    def recover(self, state):
+        snapshot, records = self.read()
+        seq = 0
+        if snapshot:
+            seq = snapshot["s"]
+            state.load_dict(snapshot["state"])
+            state.game_clock.set(snapshot["clock"])
+            state.play_clock.set(snapshot["play_clock"])
+            if state.history and snapshot.get("history"):
+                state.history.load_dict(snapshot["history"])
+            elif state.history:
+                state.history.clear()
+        replayed = 0
+        for record in records:
+            if record["s"] <= seq:
+                continue
+            state.replay(record)
+            seq = record["s"]
+            replayed += 1
+        state.pause_clock()
+        self.seq = seq
+        # Start again from a clean snapshot so nothing is appended after a torn line
+        self.write_snapshot(state)
+        self.attach(state)
+        return replayed
+
+    def close(self, discard=False):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+        if discard:
+            for path in (self.journal_path, self.snapshot_path):
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,149 @@
+from array import array
+
+# Record kinds; every box score line is one record
+PLAY, KICKOFF, BALL_MOVED, POSSESSION, SCORE, PENALTY, NOTE = range(7)
+KIND_NAMES = ("play", "kickoff", "ball_moved", "possession", "score", "penalty", "note")
+OVERTIME_QUARTER = 5
+NONE = -1
+
+# (column, array typecode); one array per column, one slot per record
+COLUMNS = (
+    ("serial", "l"),      # unique per log, never reused (history uses it to spot edits)
+    ("kind", "b"),
+    ("quarter", "b"),     # 1-4, OVERTIME_QUARTER for "OT"
+    ("clock", "h"),       # whole game clock seconds remaining when recorded
+    ("possession", "b"),  # team with the ball when recorded
+    ("play_type", "b"),   # index into PlayLog.play_types
+    ("yards", "h"),
+    ("start", "b"),       # ball_on before / after, 0-100
+    ("end", "b"),         # (after is also kept for kickoffs, possession changes and penalties)
+    ("down", "b"),        # down and distance before the play
+    ("distance", "h"),    # (losses and penalties can push it past 127)
+    ("turnover", "b"),
+    ("team", "b"),        # scoring / penalised / kicking / new possession team
+    ("value", "h"),       # points for a score, yards for a penalty
+    ("reason", "b"),      # index into PlayLog.reasons
+    ("team1_timeouts", "b"),
+    ("team2_timeouts", "b"),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+DEFAULTS = dict.fromkeys(COLUMN_NAMES, NONE)
+DEFAULTS.update(turnover=0, yards=0, value=0)
+
+
+def quarter_code(quarter):
+    return OVERTIME_QUARTER if quarter == "OT" else quarter
+
+
+def quarter_label(code):
+    return "OT" if code == OVERTIME_QUARTER else code
+
+
+class PlayLog:
+    # Typed, array-backed game log. Each column is an array.array, so a
+    # record costs a few dozen bytes instead of a formatted string; the box
+    # score text is produced on demand from the numbers (see
+    # GameState.format_entry). Rows read back as tuples in COLUMNS order.
+    # Supports what History needs from a log: len, indexing and slicing,
+    # deleting a tail slice, and extend. opening is the scoreboard when the
+    # log was started, so the game can be replayed from it (see Timeline).
+    def __init__(self, play_types=("pass", "rush", "stop"), reasons=("Turnover",), opening=None):
+        self.columns = {name: array(code) for name, code in COLUMNS}
+        self.play_types = list(play_types)
+        self.reasons = list(reasons)
+        self.opening = opening
+        self.notes = {}
+        self.next_serial = 0
+
+    def __len__(self):
+        return len(self.columns["serial"])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self.row(index)
+
+    def __delitem__(self, index):
+        start, stop, _ = index.indices(len(self)) if isinstance(index, slice) else (index, index + 1, 1)
+        if stop != len(self):
+            raise IndexError("only the tail of a PlayLog can be deleted")
+        # Notes stay keyed by serial so a redo that re-extends the rows finds them
+        for column in self.columns.values():
+            del column[start:]
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def row(self, index):
+        return tuple(column[index] for column in self.columns.values())
+
+    def key(self, index):
+        return self.columns["serial"][index]
+
+    def code(self, labels, label):
+        if label not in labels:
+            labels.append(label)
+        return labels.index(label)
+
+    def append(self, kind, text=None, **fields):
+        values = dict(DEFAULTS, **fields)
+        values["serial"] = self.next_serial
+        values["kind"] = kind
+        values["quarter"] = quarter_code(values["quarter"])
+        if text is not None:
+            self.notes[self.next_serial] = text
+        self.next_serial += 1
+        for name, column in self.columns.items():
+            column.append(values[name])
+
+    def extend(self, rows):
+        for row in rows:
+            for column, value in zip(self.columns.values(), row):
+                column.append(value)
+            self.next_serial = max(self.next_serial, row[0] + 1)
+
+    def record(self, index):
+        return dict(zip(COLUMN_NAMES, self.row(index)))
+
+    def column(self, name):
+        return self.columns[name]
+
+    def csv_rows(self):
+        # Header plus one row per record, with the small codes spelled out
+        yield COLUMN_NAMES
+        for row in self:
+            record = dict(zip(COLUMN_NAMES, row))
+            record["kind"] = KIND_NAMES[record["kind"]]
+            record["quarter"] = quarter_label(record["quarter"])
+            if record["play_type"] != NONE:
+                record["play_type"] = self.play_types[record["play_type"]]
+            if record["reason"] != NONE:
+                record["reason"] = self.reasons[record["reason"]]
+            yield tuple(record.values())
+
+    def to_dict(self):
+        return {"columns": {name: column.tolist() for name, column in self.columns.items()},
+                "play_types": self.play_types, "reasons": self.reasons, "opening": self.opening,
+                "notes": {str(serial): self.notes[serial] for serial in self.columns["serial"]
+                          if serial in self.notes}}
+
+    @classmethod
+    def from_dict(cls, data):
+        log = cls(data["play_types"], data["reasons"], data.get("opening"))
+        length = len(data["columns"]["serial"])
+        for name, code in COLUMNS:
+            # Columns added since the log was saved read as their default
+            log.columns[name] = array(code, data["columns"].get(name, [DEFAULTS[name]] * length))
+        log.notes = {int(serial): text for serial, text in data.get("notes", {}).items()}
+        log.next_serial = max(log.columns["serial"], default=-1) + 1
+        return log
+
+    @classmethod
+    def from_text(cls, entries):
+        # A log saved before records existed: keep each line as a note
+        log = cls()
+        for entry in entries:
+            log.append(NOTE, text=entry)
+        return log
@@ -0,0 +1,78 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class PlayLogView:
+    # Renders only a window of `height` entries of a (possibly huge) log.
+    # Appends, undos and clears touch single lines; scrolling re-renders the
+    # window, which costs O(height) no matter how long the log is.
+    def __init__(self, parent, entries, height=18, width=70, font=("Arial", 12)):
+        self.entries = entries
+        self.height = height
+        self.first = 0
+        self.rendered = 0
+        self.frame = ttk.Frame(parent)
+        self.text = tk.Text(self.frame, height=height, width=width, font=font, wrap="none")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.on_scroll)
+        self.text.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.text.bind("<Button-4>", lambda e: self.scroll(-1))
+        self.text.bind("<Button-5>", lambda e: self.scroll(1))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def append(self):
+        entries = self.entries()
+        if self.first + self.rendered == len(entries) - 1:
+            self.text.insert(tk.END + "-1c", entries[-1] + "\n")
+            self.rendered += 1
+            if self.rendered > self.height:
+                self.text.delete("1.0", "2.0")
+                self.first += 1
+                self.rendered -= 1
+            self.text.see(tk.END)
+        self.update_scrollbar()
+
+    def clear(self):
+        self.text.delete("1.0", tk.END)
+        self.first = 0
+        self.rendered = 0
+        self.update_scrollbar()
+
+    def reload(self):
+        self.first = max(0, len(self.entries()) - self.height)
+        self.render()
+
+    def render(self):
+        window = self.entries()[self.first:self.first + self.height]
+        self.text.delete("1.0", tk.END)
+        if window:
+            self.text.insert("1.0", "\n".join(window) + "\n")
+        self.rendered = len(window)
+        self.update_scrollbar()
+
+    def scroll(self, lines):
+        self.scroll_to(self.first + lines)
+
+    def scroll_to(self, first):
+        first = max(0, min(first, len(self.entries()) - self.height))
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.entries())))
+        elif unit == "pages":
+            self.scroll(int(amount) * self.height)
+        else:
+            self.scroll(int(amount))
+
+    def update_scrollbar(self):
+        total = len(self.entries())
+        if total <= self.height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.rendered) / total)
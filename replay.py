@@ -0,0 +1,201 @@
+import argparse
+import json
+import time
+
+from game_state import GameState
+from history import History
+from import_games import find_files
+
+SPEEDS = {"1x": 1.0, "10x": 10.0, "max": None}
+# While the game clock is stopped, longer pauses between actions are cut to this
+MAX_IDLE_SECONDS = 5.0
+# Fields of a saved game compared after replaying its recording
+COMPARED_FIELDS = ("score", "timeouts", "stats", "quarter", "down", "yards", "ball_on", "possession", "box_score")
+
+
+def copy_state(state):
+    return json.loads(json.dumps(state.to_dict()))
+
+
+class ActionRecorder:
+    # Keeps every action record of the current game together with the state
+    # it started from, so a saved game can be replayed through the engine.
+    # A reset starts a new recording; loading a game continues the recording
+    # saved with it when there is one (see adopt).
+    def __init__(self):
+        self.state = None
+        self.start = None
+        self.actions = []
+
+    def attach(self, state):
+        self.state = state
+        state.subscribe(self.on_state_event)
+        self.restart()
+
+    def restart(self):
+        self.start = {"state": copy_state(self.state), "clock": round(self.state.game_clock.remaining(), 1)}
+        self.actions = []
+
+    def on_state_event(self, event, data):
+        if event == "action":
+            self.actions.append(data["record"])
+        elif event in ("reset", "load"):
+            self.restart()
+
+    def adopt(self, recording):
+        if recording:
+            self.start = recording["start"]
+            self.actions = list(recording["actions"])
+
+    def recording(self):
+        return {"start": self.start, "actions": self.actions}
+
+
+class Replayer:
+    # Feeds a recording back through a GameState, either as fast as possible
+    # (speed None) or paced by the records' timestamps at speed times real
+    # time. The clocks read a virtual time that runs at the same speed, so a
+    # running game clock counts down between actions as it did in the game.
+    # Automatic quarter changes are off: the recorded next_quarter does it.
+    def __init__(self, recording, state=None, speed=None, max_idle=MAX_IDLE_SECONDS):
+        self.start = recording["start"]
+        self.records = recording["actions"]
+        self.speed = speed
+        self.max_idle = max_idle
+        self.index = 0
+        self.virtual = self.records[0]["t"] if self.records else 0.0
+        self.real = time.monotonic()
+        self.state = state or GameState(now=self.now)
+        self.saved_now = None
+        self.started = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def done(self):
+        return self.index >= len(self.records)
+
+    def now(self):
+        if self.speed is None:
+            return self.virtual
+        return self.virtual + (time.monotonic() - self.real) * self.speed
+
+    def begin(self):
+        state = self.state
+        if state.history is None:
+            History(state)
+        self.saved_now = (state.game_clock.now, state.play_clock.now)
+        state.game_clock.now = state.play_clock.now = self.now
+        state.auto_advance = False
+        state.load_dict(self.start["state"])
+        state.game_clock.set(self.start["clock"])
+        state.history.clear()
+        self.virtual = self.records[0]["t"] if self.records else 0.0
+        self.real = time.monotonic()
+        self.started = self.real
+
+    def next_delay(self):
+        # Real seconds until the next record is due
+        if self.done():
+            return None
+        if self.speed is None:
+            return 0.0
+        ahead = self.records[self.index]["t"] - self.now()
+        if not self.state.clock_running and ahead > self.max_idle:
+            self.virtual -= ahead - self.max_idle
+            ahead = self.max_idle
+        return max(0.0, ahead / self.speed)
+
+    def step(self):
+        record = self.records[self.index]
+        self.virtual = max(self.now(), record["t"])
+        self.real = time.monotonic()
+        self.index += 1
+        self.state.replay(record)
+        return record
+
+    def finish(self):
+        state = self.state
+        state.pause_clock()
+        state.game_clock.now, state.play_clock.now = self.saved_now
+        state.auto_advance = True
+
+    def run(self):
+        self.begin()
+        try:
+            while not self.done():
+                delay = self.next_delay()
+                if delay:
+                    time.sleep(delay)
+                self.step()
+        finally:
+            self.finish()
+        return self.state
+
+    def stats(self):
+        elapsed = time.monotonic() - self.started if self.started else 0.0
+        return {"replayed": self.index, "records": len(self.records), "seconds": elapsed,
+                "rate": self.index / elapsed if elapsed else 0.0}
+
+
+def compare(saved, state):
+    # (field, saved value, replayed value) for every difference
+    replayed = copy_state(state)
+    differences = []
+    for field in COMPARED_FIELDS:
+        if field in ("score", "timeouts", "stats"):
+            for team in ("team1", "team2"):
+                if saved[team][field] != replayed[team][field]:
+                    differences.append((f"{team}.{field}", saved[team][field], replayed[team][field]))
+        elif saved.get(field) != replayed[field]:
+            differences.append((field, saved.get(field), replayed[field]))
+    return differences
+
+
+def replay_file(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not data.get("recording"):
+        return None
+    replayer = Replayer(data["recording"])
+    return compare(data, replayer.run()), replayer.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay saved games through the rules engine and diff the results")
+    parser.add_argument("paths", nargs="+", help="saved game files or directories of them")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show every difference")
+    args = parser.parse_args()
+
+    counts = {"matched": 0, "changed": 0, "no recording": 0, "failed": 0}
+    records = 0
+    started = time.perf_counter()
+    for path in (file for target in args.paths
+                 for file in (find_files(target) if not target.endswith(".json") else [target])):
+        try:
+            result = replay_file(path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            counts["failed"] += 1
+            print(f"{path}: {error}")
+            continue
+        if result is None:
+            counts["no recording"] += 1
+            continue
+        differences, stats = result
+        records += stats["replayed"]
+        if not differences:
+            counts["matched"] += 1
+            continue
+        counts["changed"] += 1
+        print(f"{path}: {len(differences)} fields differ")
+        for field, saved, replayed in differences if args.verbose else differences[:3]:
+            if field == "box_score":
+                saved, replayed = f"{len(saved)} lines", f"{len(replayed)} lines"
+            print(f"  {field}: saved {saved}, replayed {replayed}")
+    elapsed = time.perf_counter() - started
+    print(", ".join(f"{count} {name}" for name, count in counts.items()))
+    print(f"{records} actions replayed in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import argparse
+import concurrent.futures
+import csv
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+from simulator import DEFAULT_RULES, simulate_games
+
+# Overtime rules a variant can use: none (a tie stands), a timed overtime
+# period, or an overtime that the first touchdown ends
+OVERTIME_RULES = {
+    "none": {"overtime": False, "sudden_death": False},
+    "timed": {"overtime": True, "sudden_death": False},
+    "sudden-death": {"overtime": True, "sudden_death": True},
+}
+# Games per task; every task draws from its own SeedSequence child, so the
+# results do not depend on the number of workers or the order tasks finish
+CHUNK_GAMES = 5000
+TALLIES = ("games", "points", "touchdowns", "plays", "seconds", "ties", "overtimes", "unfinished")
+TABLE = (
+    ("points/game", "points", "{:.2f}"),
+    ("TD/game", "touchdowns", "{:.2f}"),
+    ("plays/game", "plays", "{:.1f}"),
+    ("minutes/game", "minutes", "{:.1f}"),
+    ("ties %", "ties", "{:.2f}"),
+    ("OT %", "overtimes", "{:.2f}"),
+)
+
+
+def variant_rules(quarter_minutes, timeouts, play_seconds, overtime):
+    return dict(quarter_seconds=quarter_minutes * 60, timeouts_per_half=timeouts, play_seconds=play_seconds,
+                **OVERTIME_RULES[overtime])
+
+
+def variant_label(quarter_minutes, timeouts, play_seconds, overtime):
+    return f"{quarter_minutes}-min quarters, {timeouts} TO, {play_seconds}s play, OT {overtime}"
+
+
+def run_chunk(task):
+    # One task in a worker process: (variant index, rules, games, seed) to
+    # the variant index and its tallies
+    variant, rules, games, seed = task
+    results = simulate_games(games, rules, rng=np.random.default_rng(seed))
+    team1 = results["team1_score"].astype(np.int64)
+    team2 = results["team2_score"].astype(np.int64)
+    return variant, {
+        "games": games,
+        "points": int((team1 + team2).sum()),
+        "touchdowns": int((results["team1_touchdowns"] + results["team2_touchdowns"]).sum()),
+        "plays": int((results["team1_plays"] + results["team2_plays"]).sum()),
+        "seconds": int(results["game_seconds"].sum()),
+        "ties": int((team1 == team2).sum()),
+        "overtimes": int(results["overtime"].sum()),
+        "unfinished": int(results["unfinished"].sum()),
+    }
+
+
+def make_tasks(variants, games, seed=None, chunk_games=CHUNK_GAMES):
+    # Each variant gets a child of the root SeedSequence and each of its
+    # chunks a grandchild, so adding a variant leaves the others' draws alone
+    streams = np.random.SeedSequence(seed).spawn(len(variants))
+    tasks = []
+    for variant, (rules, stream) in enumerate(zip(variants, streams)):
+        sizes = [min(chunk_games, games - start) for start in range(0, games, chunk_games)]
+        tasks.extend((variant, rules, size, child) for size, child in zip(sizes, stream.spawn(len(sizes))))
+    return tasks
+
+
+def sweep(variants, games, seed=None, workers=None, chunk_games=CHUNK_GAMES):
+    # Tallies per variant, summed over its chunks; workers=1 runs in process
+    totals = [dict.fromkeys(TALLIES, 0) for _ in variants]
+    tasks = make_tasks(variants, games, seed, chunk_games)
+    if workers == 1:
+        done = list(map(run_chunk, tasks))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(run_chunk, tasks))
+    for variant, tally in done:
+        for name in TALLIES:
+            totals[variant][name] += tally[name]
+    return totals
+
+
+def rates(totals):
+    games = totals["games"]
+    return {
+        "points": totals["points"] / games,
+        "touchdowns": totals["touchdowns"] / games,
+        "plays": totals["plays"] / games,
+        "minutes": totals["seconds"] / games / 60,
+        "ties": 100 * totals["ties"] / games,
+        "overtimes": 100 * totals["overtimes"] / games,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate every combination of rule variants and compare them")
+    parser.add_argument("--games", type=int, default=20000, help="games per variant")
+    parser.add_argument("--quarter-minutes", type=int, nargs="+", default=[DEFAULT_RULES["quarter_seconds"] // 60])
+    parser.add_argument("--timeouts", type=int, nargs="+", default=[DEFAULT_RULES["timeouts_per_half"]])
+    parser.add_argument("--play-seconds", type=int, nargs="+", default=[DEFAULT_RULES["play_seconds"]])
+    parser.add_argument("--overtime", nargs="+", choices=OVERTIME_RULES, default=["none"])
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--csv", help="also write the table to this file")
+    args = parser.parse_args()
+
+    combinations = list(itertools.product(args.quarter_minutes, args.timeouts, args.play_seconds, args.overtime))
+    seed = args.seed if args.seed is not None else np.random.SeedSequence().entropy
+    started = time.perf_counter()
+    totals = sweep([variant_rules(*combination) for combination in combinations], args.games, seed, args.workers)
+    elapsed = time.perf_counter() - started
+
+    labels = [variant_label(*combination) for combination in combinations]
+    width = max(len(label) for label in labels)
+    print(f"{'variant':<{width}}" + "".join(f"{heading:>14}" for heading, _, _ in TABLE))
+    rows = []
+    for label, tally in zip(labels, totals):
+        row = rates(tally)
+        rows.append([label] + [row[key] for _, key, _ in TABLE])
+        print(f"{label:<{width}}" + "".join(f"{form.format(row[key]):>14}" for _, key, form in TABLE))
+        if tally["unfinished"]:
+            print(f"  {tally['unfinished']} games hit the play limit", file=sys.stderr)
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["variant"] + [heading for heading, _, _ in TABLE])
+            writer.writerows(rows)
+    games = args.games * len(combinations)
+    print(f"{games:,} games over {len(combinations)} variants in {elapsed:.1f} s "
+          f"({games / elapsed:,.0f} games/s, {args.workers} workers, seed {seed})")
+
+
+if __name__ == "__main__":
+    main()
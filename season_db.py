@@ -0,0 +1,415 @@
+import argparse
+import datetime
+import sqlite3
+import time
+
+from history import SKIPPED_ACTIONS
+
+SEASON_DB = "season.db"
+OVERTIME_QUARTER = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    season INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    team1 TEXT NOT NULL,
+    team2 TEXT NOT NULL,
+    team1_score INTEGER NOT NULL,
+    team2_score INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    source_hash TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS plays (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    seq INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    quarter INTEGER NOT NULL,
+    clock REAL,
+    down INTEGER,
+    distance INTEGER,
+    ball_on INTEGER,
+    yards_to_goal INTEGER,
+    field_zone TEXT,
+    play_type TEXT NOT NULL,
+    yards INTEGER,
+    turnover INTEGER NOT NULL DEFAULT 0,
+    touchdown INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (game_id, seq)
+);
+CREATE TABLE IF NOT EXISTS scores (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    seq INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    clock REAL,
+    PRIMARY KEY (game_id, seq)
+);
+CREATE TABLE IF NOT EXISTS penalties (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    seq INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    yards INTEGER NOT NULL,
+    quarter INTEGER NOT NULL,
+    clock REAL,
+    PRIMARY KEY (game_id, seq)
+);
+CREATE TABLE IF NOT EXISTS team_stats (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    slot INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    first_downs INTEGER NOT NULL,
+    total_yards INTEGER NOT NULL,
+    pass_yards INTEGER NOT NULL,
+    rush_yards INTEGER NOT NULL,
+    penalties INTEGER NOT NULL,
+    PRIMARY KEY (game_id, slot)
+);
+CREATE INDEX IF NOT EXISTS games_season ON games(season);
+CREATE INDEX IF NOT EXISTS games_team1 ON games(team1, season);
+CREATE INDEX IF NOT EXISTS games_team2 ON games(team2, season);
+CREATE INDEX IF NOT EXISTS plays_team ON plays(team, play_type);
+CREATE INDEX IF NOT EXISTS plays_quarter ON plays(quarter);
+CREATE INDEX IF NOT EXISTS plays_down ON plays(down, distance);
+CREATE INDEX IF NOT EXISTS plays_zone ON plays(field_zone);
+CREATE INDEX IF NOT EXISTS scores_team ON scores(team);
+CREATE INDEX IF NOT EXISTS penalties_team ON penalties(team);
+CREATE INDEX IF NOT EXISTS team_stats_team ON team_stats(team);
+"""
+# team_stats used to be keyed by team name, so a game between two teams of
+# the same name kept one set of stats; old rows take the slot their name has
+MIGRATE_TEAM_STATS = """
+BEGIN;
+DROP INDEX team_stats_team;
+ALTER TABLE team_stats RENAME TO team_stats_by_name;
+""" + SCHEMA + """
+INSERT INTO team_stats
+    SELECT ts.game_id, CASE WHEN ts.team = g.team1 THEN 1 ELSE 2 END, ts.team, ts.first_downs, ts.total_yards,
+           ts.pass_yards, ts.rush_yards, ts.penalties
+    FROM team_stats_by_name ts JOIN games g ON g.id = ts.game_id;
+DROP TABLE team_stats_by_name;
+COMMIT;
+"""
+ROW_INSERTS = {
+    "plays": "INSERT INTO plays VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "scores": "INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?)",
+    "penalties": "INSERT INTO penalties VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+QUERIES = {
+    "rush_yards_per_game": """
+        SELECT ts.team, COUNT(*) AS games, ROUND(AVG(ts.rush_yards), 1) AS rush_yards_per_game
+        FROM team_stats ts JOIN games g ON g.id = ts.game_id
+        WHERE g.season = :season AND g.status = 'final'
+        GROUP BY ts.team ORDER BY rush_yards_per_game DESC""",
+    "red_zone_touchdown_rate": """
+        SELECT p.team, COUNT(*) AS plays, ROUND(AVG(p.touchdown), 3) AS touchdown_rate
+        FROM plays p JOIN games g ON g.id = p.game_id
+        WHERE g.season = :season AND g.status = 'final' AND p.field_zone = 'red_zone'
+        GROUP BY p.team ORDER BY touchdown_rate DESC""",
+    "third_down_conversions": """
+        SELECT p.team, COUNT(*) AS attempts, SUM(p.yards >= p.distance) AS conversions
+        FROM plays p JOIN games g ON g.id = p.game_id
+        WHERE g.season = :season AND g.status = 'final' AND p.down = 3
+        GROUP BY p.team ORDER BY conversions DESC""",
+    "points_by_quarter": """
+        SELECT s.team, s.quarter, SUM(s.points) AS points
+        FROM scores s JOIN games g ON g.id = s.game_id
+        WHERE g.season = :season AND g.status = 'final'
+        GROUP BY s.team, s.quarter ORDER BY s.team, s.quarter""",
+}
+
+
+def connect(path=SEASON_DB):
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(SCHEMA)
+    if "slot" not in [column[1] for column in db.execute("PRAGMA table_info(team_stats)")]:
+        db.executescript(MIGRATE_TEAM_STATS)
+    return db
+
+
+def current_season():
+    return datetime.date.today().year
+
+
+def quarter_number(quarter):
+    return OVERTIME_QUARTER if quarter == "OT" else quarter
+
+
+def yards_to_goal(team, ball_on):
+    # Team 1 drives toward yard 0, team 2 toward yard 100
+    return ball_on if team == 1 else 100 - ball_on
+
+
+def field_zone(to_goal):
+    if to_goal <= 20:
+        return "red_zone"
+    if to_goal <= 50:
+        return "opponent"
+    if to_goal <= 80:
+        return "own"
+    return "backed_up"
+
+
+def new_game(season, team1, team2, played_at=None):
+    # A game as plain rows, ready for save_game. Play/score/penalty rows are
+    # tuples in column order, without game_id; stats are keyed by team slot.
+    return {"season": season, "played_at": played_at or time.time(), "team1": team1, "team2": team2,
+            "team1_score": 0, "team2_score": 0, "status": "in_progress", "source_hash": None,
+            "plays": [], "scores": [], "penalties": [], "stats": {}}
+
+
+def game_values(game):
+    return (game["season"], game["played_at"], game["team1"], game["team2"], game["team1_score"],
+            game["team2_score"], game["status"], game["source_hash"])
+
+
+def save_stats(db, game, game_id):
+    db.executemany("INSERT OR REPLACE INTO team_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                   [(game_id, slot, game[f"team{slot}"], stats["first_downs"], stats["total_yards"],
+                     stats["pass_yards"], stats["rush_yards"], stats["penalties"])
+                    for slot, stats in game["stats"].items()])
+
+
+def save_game(db, game):
+    # Inserts one game and all its rows; the caller owns the transaction so
+    # many games can share one
+    game_id = db.execute("INSERT INTO games (season, played_at, team1, team2, team1_score, team2_score, "
+                         "status, source_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", game_values(game)).lastrowid
+    for table, insert in ROW_INSERTS.items():
+        db.executemany(insert, [(game_id,) + row for row in game[table]])
+    save_stats(db, game, game_id)
+    return game_id
+
+
+def update_game(db, game, game_id, changes):
+    # Brings a saved game up to date: its games row, its team stats, and
+    # the (table, row, added) changes to its rows since it was last written
+    db.execute("UPDATE games SET season = ?, played_at = ?, team1 = ?, team2 = ?, team1_score = ?, "
+               "team2_score = ?, status = ?, source_hash = ? WHERE id = ?", game_values(game) + (game_id,))
+    for table, row, added in changes:
+        if added:
+            db.execute(ROW_INSERTS[table], (game_id,) + row)
+        else:
+            db.execute(f"DELETE FROM {table} WHERE game_id = ? AND seq = ?", (game_id, row[0]))
+    save_stats(db, game, game_id)
+
+
+def load_game(db, game_id):
+    # The rows save_game wrote for game_id, in the same shape
+    (season, played_at, team1, team2, team1_score, team2_score, status, source_hash) = db.execute(
+        "SELECT season, played_at, team1, team2, team1_score, team2_score, status, source_hash "
+        "FROM games WHERE id = ?", (game_id,)).fetchone()
+    game = new_game(season, team1, team2, played_at)
+    game.update(team1_score=team1_score, team2_score=team2_score, status=status, source_hash=source_hash)
+    for table in ("plays", "scores", "penalties"):
+        game[table] = [row[1:] for row in db.execute(
+            f"SELECT * FROM {table} WHERE game_id = ? ORDER BY seq", (game_id,))]
+    return game
+
+
+def run_query(db, name, **params):
+    cursor = db.execute(QUERIES[name], params)
+    columns = [column[0] for column in cursor.description]
+    return columns, cursor.fetchall()
+
+
+class SeasonRecorder:
+    # Records the live game into the season database. Plays, scores and
+    # penalties are kept as rows grouped by the action that made them, the
+    # same way History groups its entries, so an undo or redo moves exactly
+    # those rows. flush() writes the game in one transaction when anything
+    # changed; the app calls it from its once-a-second maintenance loop. A
+    # game is only inserted once it has a play, score or penalty; after that
+    # a flush writes just the row changes made since the last one.
+    def __init__(self, db, season=None):
+        self.db = db
+        self.season = season or current_season()
+        self.state = None
+        self.game = None
+        self.game_id = None
+        self.dirty = False
+        self.seq = 0
+        self.depth = 0
+        self.group = None
+        self.undo_groups = []
+        self.redo_groups = []
+        self.changes = []
+        self.context = None
+        self.flushes = 0
+        self.flush_seconds = 0.0
+
+    def attach(self, state):
+        self.state = state
+        state.subscribe(self.on_state_event)
+        self.start_game()
+
+    def start_game(self):
+        self.game = new_game(self.season, self.state.team1_name, self.state.team2_name)
+        self.game_id = None
+        self.undo_groups.clear()
+        self.redo_groups.clear()
+        self.changes.clear()
+        self.dirty = True
+
+    def close_game(self):
+        # Writes the current game and records nothing more until a reset,
+        # load or kickoff starts the next one
+        self.flush()
+        self.game = None
+        self.game_id = None
+        self.undo_groups.clear()
+        self.redo_groups.clear()
+        self.changes.clear()
+
+    def unfinished_game(self):
+        # The latest game of the season between the current teams that never
+        # reached its final whistle: the one a crash interrupted
+        state = self.state
+        row = self.db.execute(
+            "SELECT id FROM games WHERE season = ? AND status = 'in_progress' AND team1 = ? AND team2 = ? "
+            "ORDER BY id DESC LIMIT 1", (self.season, state.team1_name, state.team2_name)).fetchone()
+        return row[0] if row else None
+
+    def resume(self, game_id):
+        # Carries on with a game already in the database, so a recovered or
+        # loaded game updates its row instead of adding a second one
+        if game_id is None or self.db.execute("SELECT 1 FROM games WHERE id = ?", (game_id,)).fetchone() is None:
+            return False
+        self.game = load_game(self.db, game_id)
+        self.game_id = game_id
+        self.seq = max([self.seq] + [row[0] for table in ("plays", "scores", "penalties")
+                                     for row in self.game[table]])
+        self.undo_groups.clear()
+        self.redo_groups.clear()
+        self.changes.clear()
+        self.dirty = True
+        return True
+
+    def situation(self):
+        state = self.state
+        to_goal = yards_to_goal(state.possession, state.ball_on)
+        return (state.team_name(state.possession), quarter_number(state.quarter),
+                round(state.game_clock.remaining(), 1), state.down, state.yards_to_go, state.ball_on,
+                to_goal, field_zone(to_goal))
+
+    def on_state_event(self, event, data):
+        if event == "action":
+            self.depth += 1
+            name = data["record"]["a"]
+            if self.depth == 1:
+                if self.game is None and name == "kickoff":
+                    self.start_game()
+                self.group = [] if name not in SKIPPED_ACTIONS else None
+            if name == "process_play":
+                self.context = self.situation()
+        elif event == "action_done":
+            self.depth -= 1
+            if self.depth == 0 and self.group is not None:
+                self.undo_groups.append(self.group)
+                self.redo_groups.clear()
+                self.group = None
+        elif event == "play" and self.context:
+            play = data["play"]
+            self.add("plays", self.context + (play["type"], play["yards"], int(data["turnover"]),
+                                              int(data["touchdown"])))
+            self.context = None
+        elif event == "score":
+            self.on_score(data["team"], data["points"])
+        elif event == "penalty":
+            state = self.state
+            self.add("penalties", (state.team_name(data["team"]), data["yards"],
+                                   quarter_number(state.quarter), round(state.game_clock.remaining(), 1)))
+        elif event == "restore":
+            groups, other = ((self.undo_groups, self.redo_groups) if data["undo"]
+                             else (self.redo_groups, self.undo_groups))
+            if groups:
+                group = groups.pop()
+                for table, row, added in (reversed(group) if data["undo"] else group):
+                    self.apply(table, row, added != data["undo"])
+                other.append(group)
+            self.dirty = True
+        elif event in ("reset", "load"):
+            self.start_game()
+        elif event in ("names", "stats"):
+            self.dirty = True
+        elif event == "game_over" and self.game is not None:
+            self.game["status"] = "final"
+            self.dirty = True
+            self.flush()
+
+    def on_score(self, team, points):
+        state = self.state
+        self.add("scores", (state.team_name(team), points, quarter_number(state.quarter),
+                            round(state.game_clock.remaining(), 1)))
+
+    def add(self, table, row):
+        if self.game is None:
+            return
+        self.seq += 1
+        self.record(table, (self.seq,) + row, True)
+
+    def record(self, table, row, added):
+        self.apply(table, row, added)
+        if self.group is not None:
+            self.group.append((table, row, added))
+
+    def apply(self, table, row, add):
+        rows = self.game[table]
+        if add:
+            rows.append(row)
+        else:
+            rows.remove(row)
+        if self.game_id is not None:
+            self.changes.append((table, row, add))
+        self.dirty = True
+
+    def flush(self):
+        if not self.dirty or self.game is None:
+            return False
+        if self.game_id is None and not any(self.game[table] for table in ("plays", "scores", "penalties")):
+            return False
+        started = time.perf_counter()
+        state = self.state
+        game = self.game
+        game["team1"], game["team2"] = state.team1_name, state.team2_name
+        game["team1_score"], game["team2_score"] = state.team1_score, state.team2_score
+        game["stats"] = {1: state.team1_stats, 2: state.team2_stats}
+        with self.db:
+            if self.game_id is None:
+                self.game_id = save_game(self.db, game)
+            else:
+                update_game(self.db, game, self.game_id, self.changes)
+        self.changes.clear()
+        self.dirty = False
+        self.flushes += 1
+        self.flush_seconds += time.perf_counter() - started
+        return True
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season reports from the scoreboard database")
+    parser.add_argument("report", choices=sorted(QUERIES))
+    parser.add_argument("--db", default=SEASON_DB)
+    parser.add_argument("--season", type=int, default=current_season())
+    args = parser.parse_args()
+
+    db = connect(args.db)
+    started = time.perf_counter()
+    columns, rows = run_query(db, args.report, season=args.season)
+    elapsed = time.perf_counter() - started
+    print("  ".join(f"{column:>20}" for column in columns))
+    for row in rows:
+        print("  ".join(f"{value!s:>20}" for value in row))
+    print(f"{len(rows)} rows in {1000 * elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+import argparse
+import time
+
+import numpy as np
+
+from game_state import PLAY_TYPES
+from play_log import PLAY, SCORE, PENALTY, NOTE, NONE, quarter_code
+from season_db import SEASON_DB, connect, current_season
+
+SEASON_STORE = "season_plays.npz"
+# (column, dtype); offense and team are codes into SeasonStore.teams,
+# play_type into SeasonStore.play_types. About 23 bytes a record.
+COLUMNS = (
+    ("game", np.uint32),
+    ("kind", np.int8),
+    ("quarter", np.int8),
+    ("clock", np.int16),
+    ("offense", np.int16),    # team with the ball
+    ("play_type", np.int8),
+    ("yards", np.int16),
+    ("start", np.int8),
+    ("end", np.int8),
+    ("down", np.int8),
+    ("distance", np.int16),
+    ("turnover", np.int8),
+    ("team", np.int16),       # scoring / penalised / kicking / new possession team
+    ("value", np.int16),      # points for a score, yards for a penalty
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+DEFAULTS = dict.fromkeys(COLUMN_NAMES, NONE)
+DEFAULTS.update(turnover=0, yards=0, value=0)
+TEAM_STATS = ("plays", "first_downs", "total_yards", "pass_yards", "rush_yards", "touchdowns",
+              "turnovers", "penalties", "penalty_yards", "points")
+
+
+class SeasonStore:
+    # Every record of many games in one set of NumPy columns, in game order.
+    # Teams and play types are small integer codes, so a 100k-play season
+    # is a couple of MB, and season stats are a few bincounts over the
+    # columns instead of a loop over per-play dicts.
+    def __init__(self, capacity=1024):
+        self.data = {name: np.empty(capacity, dtype) for name, dtype in COLUMNS}
+        self.length = 0
+        self.teams = []
+        self.team_codes = {}
+        self.play_types = list(PLAY_TYPES)
+        self.game_teams = []
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return {name: column[index].item() for name, column in self.columns().items()}
+        # A slice shares the columns and the code tables; it is for reading
+        view = SeasonStore(0)
+        view.data = {name: column[index] for name, column in self.columns().items()}
+        view.length = len(view.data["game"])
+        view.teams, view.team_codes = self.teams, self.team_codes
+        view.play_types, view.game_teams = self.play_types, self.game_teams
+        return view
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns().values())
+
+    def column(self, name):
+        return self.data[name][:self.length]
+
+    def columns(self):
+        return {name: self.column(name) for name in COLUMN_NAMES}
+
+    def team_code(self, name):
+        if name not in self.team_codes:
+            self.team_codes[name] = len(self.teams)
+            self.teams.append(name)
+        return self.team_codes[name]
+
+    def type_code(self, label):
+        if label not in self.play_types:
+            self.play_types.append(label)
+        return self.play_types.index(label)
+
+    def reserve(self, extra):
+        needed = self.length + extra
+        capacity = len(self.data["game"])
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 1024)
+        for name, column in self.data.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self.length] = column[:self.length]
+            self.data[name] = grown
+
+    def new_game(self, team1, team2):
+        self.game_teams.append((self.team_code(team1), self.team_code(team2)))
+        return len(self.game_teams) - 1
+
+    def append(self, game, kind, **fields):
+        self.reserve(1)
+        values = dict(DEFAULTS, game=game, kind=kind, **fields)
+        for name in COLUMN_NAMES:
+            self.data[name][self.length] = values[name]
+        self.length += 1
+
+    def add_game(self, team1, team2, plays):
+        # Copies a game's PlayLog in one pass per column: its 1/2 teams and
+        # its play type codes are translated through small lookup arrays
+        game = self.new_game(team1, team2)
+        source = {name: np.asarray(column) for name, column in plays.columns.items()}
+        keep = source["kind"] != NOTE
+        count = int(keep.sum())
+        self.reserve(count)
+        teams = np.array((NONE,) + self.game_teams[game], dtype=np.int16)
+        types = np.array([self.type_code(label) for label in plays.play_types] + [NONE], dtype=np.int8)
+        rows = slice(self.length, self.length + count)
+        self.data["game"][rows] = game
+        for name in ("kind", "quarter", "clock", "yards", "start", "end", "down", "distance", "turnover", "value"):
+            self.data[name][rows] = source[name][keep]
+        # Index -1 (no team / no play type) lands on the NONE slot at the end
+        self.data["offense"][rows] = teams[np.maximum(source["possession"][keep], 0)]
+        self.data["team"][rows] = teams[np.maximum(source["team"][keep], 0)]
+        self.data["play_type"][rows] = types[source["play_type"][keep]]
+        self.length += count
+        return game
+
+    def game_rows(self, game):
+        games = self.column("game")
+        return self[np.searchsorted(games, game):np.searchsorted(games, game, side="right")]
+
+    def team_stats(self):
+        # The engine's per-team stats, recomputed for every game in one
+        # vectorized pass per stat
+        kind, offense, team = self.column("kind"), self.column("offense"), self.column("team")
+        yards, end = self.column("yards"), self.column("end")
+        play = kind == PLAY
+        touchdown = play & ((end == 0) | (end == 100))
+        turnover = play & ~touchdown & (self.column("turnover") != 0)
+        first_down = play & ~touchdown & ~turnover & (yards >= self.column("distance"))
+        play_type = self.column("play_type")
+        pass_play = play & (play_type == self.type_code("pass"))
+        rush_play = play & (play_type == self.type_code("rush"))
+        penalty = kind == PENALTY
+        score = kind == SCORE
+        size = len(self.teams)
+
+        def total(by, mask, weights=None):
+            return np.bincount(by[mask], None if weights is None else weights[mask], minlength=size).astype(np.int64)
+
+        totals = {
+            "plays": total(offense, play),
+            "first_downs": total(offense, first_down),
+            "total_yards": total(offense, play, yards),
+            "pass_yards": total(offense, pass_play, yards),
+            "rush_yards": total(offense, rush_play, yards),
+            "touchdowns": total(offense, touchdown),
+            "turnovers": total(offense, turnover),
+            "penalties": total(team, penalty),
+            "penalty_yards": total(team, penalty, self.column("value")),
+            "points": total(team, score, self.column("value")),
+        }
+        return {name: {stat: int(totals[stat][code]) for stat in TEAM_STATS}
+                for code, name in enumerate(self.teams)}
+
+    def save(self, path=SEASON_STORE):
+        np.savez(path, teams=np.array(self.teams, dtype=str), play_types=np.array(self.play_types, dtype=str),
+                 game_teams=np.array(self.game_teams, dtype=np.int16).reshape(-1, 2), **self.columns())
+
+    @classmethod
+    def load(cls, path=SEASON_STORE):
+        with np.load(path) as data:
+            store = cls(0)
+            store.data = {name: data[name].astype(dtype, copy=False) for name, dtype in COLUMNS}
+            store.length = len(store.data["game"])
+            store.teams = data["teams"].tolist()
+            store.team_codes = {name: code for code, name in enumerate(store.teams)}
+            store.play_types = data["play_types"].tolist()
+            store.game_teams = [tuple(pair) for pair in data["game_teams"].tolist()]
+        return store
+
+    @classmethod
+    def from_season_db(cls, db, season):
+        # Plays, scores and penalties of the season's games, merged back into
+        # log order by (game, seq)
+        store = cls()
+        games = {}
+        rows = db.execute("""
+            SELECT g.id, g.team1, g.team2, r.seq, r.kind, r.team, r.quarter, r.clock, r.down, r.distance,
+                   r.ball_on, r.play_type, r.yards, r.turnover, r.touchdown, r.value
+            FROM games g JOIN (
+                SELECT game_id, seq, :play AS kind, team, quarter, clock, down, distance, ball_on,
+                       play_type, yards, turnover, touchdown, 0 AS value FROM plays
+                UNION ALL
+                SELECT game_id, seq, :score, team, quarter, clock, NULL, NULL, NULL, NULL, 0, 0, 0, points
+                FROM scores
+                UNION ALL
+                SELECT game_id, seq, :penalty, team, quarter, clock, NULL, NULL, NULL, NULL, 0, 0, 0, yards
+                FROM penalties
+            ) r ON r.game_id = g.id
+            WHERE g.season = :season
+            ORDER BY g.id, r.seq, r.kind""", {"season": season, "play": PLAY, "score": SCORE, "penalty": PENALTY})
+        for (game_id, team1, team2, _, kind, team, quarter, clock, down, distance, ball_on, play_type,
+             yards, turnover, touchdown, value) in rows:
+            if game_id not in games:
+                games[game_id] = store.new_game(team1, team2)
+            fields = {"quarter": quarter_code(quarter), "clock": int(clock or 0)}
+            code = store.team_code(team)
+            if kind == PLAY:
+                # Team 1 drives toward yard 0, team 2 toward yard 100
+                forward = -1 if team == team1 else 1
+                end = (50 + 50 * forward if touchdown
+                       else max(1, min(99, ball_on + forward * yards)) if ball_on is not None else NONE)
+                fields.update(offense=code, play_type=store.type_code(play_type), yards=yards,
+                              start=NONE if ball_on is None else ball_on, end=end,
+                              down=NONE if down is None else down,
+                              distance=NONE if distance is None else distance, turnover=turnover)
+            else:
+                fields.update(team=code, value=value)
+            store.append(games[game_id], kind, **fields)
+        return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a columnar play store from the season database")
+    parser.add_argument("--db", default=SEASON_DB)
+    parser.add_argument("--season", type=int, default=current_season())
+    parser.add_argument("--out", default=SEASON_STORE)
+    args = parser.parse_args()
+
+    db = connect(args.db)
+    store = SeasonStore.from_season_db(db, args.season)
+    db.close()
+    store.save(args.out)
+    started = time.perf_counter()
+    stats = store.team_stats()
+    elapsed = time.perf_counter() - started
+    print(f"{len(store)} records from {len(store.game_teams)} games, {store.nbytes / 1024:.0f} KiB -> {args.out}")
+    print(f"{'team':>20}" + "".join(f"{stat:>14}" for stat in TEAM_STATS))
+    for team, totals in sorted(stats.items()):
+        print(f"{team:>20}" + "".join(f"{totals[stat]:>14}" for stat in TEAM_STATS))
+    print(f"stats for {len(stats)} teams in {1000 * elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import argparse
+import time
+
+import numpy as np
+
+from game_state import QUARTER_SECONDS, OVERTIME_SECONDS, TIMEOUTS_PER_HALF, OVERTIME_TIMEOUTS, \
+    PLAY_TYPES, SIMULATED_YARDS
+
+# Same play distribution as FootballScoreboard.simulate_play, plus the clock
+# runoff an electric football snap takes: the play timer (set_play_time)
+# and the huddle between plays, which a timeout saves.
+DEFAULT_RULES = {
+    "quarter_seconds": QUARTER_SECONDS,
+    "play_seconds": 10,
+    "huddle_seconds": 20,
+    "timeouts_per_half": TIMEOUTS_PER_HALF,
+    "timeout_window": 120,
+    "overtime": False,
+    "overtime_seconds": OVERTIME_SECONDS,
+    "overtime_timeouts": OVERTIME_TIMEOUTS,
+    "sudden_death": False,
+    "min_yards": SIMULATED_YARDS[0],
+    "max_yards": SIMULATED_YARDS[1],
+    "kick_distance": 65,
+    "return_yards": 20,
+    "pat_rate": 1.0,
+    "max_plays": 1000,
+}
+
+
+def spot(team, own_yard_line):
+    return np.where(team == 1, 100 - own_yard_line, own_yard_line)
+
+
+def simulate_games(n_games, rules=None, rng=None, seed=None, observe=None):
+    # observe(games, situation) is called before every play with the active
+    # games' indices and their situation arrays (see win_probability.py)
+    rules = dict(DEFAULT_RULES, **(rules or {}))
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    n = n_games
+    all_games = np.arange(n)
+
+    quarter = np.ones(n, dtype=np.int8)
+    seconds = np.full(n, rules["quarter_seconds"], dtype=np.int32)
+    elapsed = np.zeros(n, dtype=np.int32)
+    score = np.zeros((n, 3), dtype=np.int16)
+    timeouts = np.full((n, 3), rules["timeouts_per_half"], dtype=np.int8)
+    stats = {key: np.zeros((n, 3), dtype=np.int32)
+             for key in ("plays", "first_downs", "total_yards", "pass_yards", "rush_yards",
+                         "touchdowns", "turnovers_on_downs")}
+    down = np.ones(n, dtype=np.int8)
+    yards_to_go = np.full(n, 10, dtype=np.int16)
+    active = np.ones(n, dtype=bool)
+    overtime = np.zeros(n, dtype=bool)
+
+    # Coin toss for the opening kickoff; the kicking team alternates each quarter
+    opening_kicker = rng.integers(1, 3, size=n).astype(np.int8)
+    possession = np.where(opening_kicker == 1, 2, 1).astype(np.int8)
+    receive_spot = max(1, min(99, rules["kick_distance"] - rules["return_yards"]))
+    ball_on = spot(possession, receive_spot).astype(np.int16)
+
+    for _ in range(rules["max_plays"]):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        team = possession[idx]
+        if observe:
+            observe(idx, {"possession": team, "score": score[idx], "quarter": quarter[idx],
+                          "seconds": seconds[idx], "down": down[idx], "yards_to_go": yards_to_go[idx],
+                          "ball_on": ball_on[idx], "timeouts": timeouts[idx]})
+        yards = rng.integers(rules["min_yards"], rules["max_yards"] + 1, size=idx.size)
+        play_type = rng.integers(0, len(PLAY_TYPES), size=idx.size)
+
+        stats["plays"][idx, team] += 1
+        stats["total_yards"][idx, team] += yards
+        stats["pass_yards"][idx, team] += np.where(play_type == PLAY_TYPES.index("pass"), yards, 0)
+        stats["rush_yards"][idx, team] += np.where(play_type == PLAY_TYPES.index("rush"), yards, 0)
+
+        new_pos = ball_on[idx] + np.where(team == 1, -yards, yards)
+        touchdown = (new_pos <= 0) | (new_pos >= 100)
+        ball_on[idx] = np.clip(new_pos, 1, 99)
+
+        ytg = yards_to_go[idx] - yards
+        first_down = ~touchdown & (ytg <= 0)
+        on_downs = ~touchdown & ~first_down & (down[idx] == 4)
+        keep = ~touchdown & ~first_down & ~on_downs
+        stats["first_downs"][idx[first_down], team[first_down]] += 1
+        stats["turnovers_on_downs"][idx[on_downs], team[on_downs]] += 1
+        down[idx] = np.where(keep, down[idx] + 1, 1)
+        yards_to_go[idx] = np.where(keep, ytg, 10)
+
+        td_idx = idx[touchdown]
+        td_team = team[touchdown]
+        pat = rng.random(td_idx.size) < rules["pat_rate"]
+        score[td_idx, td_team] += 6 + pat
+        stats["touchdowns"][td_idx, td_team] += 1
+        ball_on[td_idx] = spot(3 - td_team, 35)
+        flip = touchdown | on_downs
+        possession[idx[flip]] = 3 - team[flip]
+
+        # Clock: the trailing team burns a timeout late in each half to save the huddle
+        runoff = np.full(idx.size, rules["play_seconds"] + rules["huddle_seconds"], dtype=np.int32)
+        trailing = np.where(score[idx, 1] < score[idx, 2], 1, np.where(score[idx, 2] < score[idx, 1], 2, 0))
+        late = ((quarter[idx] == 2) | (quarter[idx] >= 4)) & (seconds[idx] <= rules["timeout_window"])
+        use_timeout = late & (trailing > 0) & (timeouts[idx, trailing] > 0)
+        timeouts[idx[use_timeout], trailing[use_timeout]] -= 1
+        runoff[use_timeout] = rules["play_seconds"]
+        runoff = np.minimum(runoff, seconds[idx])
+        seconds[idx] -= runoff
+        elapsed[idx] += runoff
+
+        if rules["sudden_death"]:
+            decided = overtime[idx] & touchdown
+            active[idx[decided]] = False
+
+        ended = idx[active[idx] & (seconds[idx] <= 0)]
+        if ended.size:
+            tied = score[ended, 1] == score[ended, 2]
+            final = (quarter[ended] >= 5) | ((quarter[ended] == 4) & ~(tied & rules["overtime"]))
+            active[ended[final]] = False
+            nxt = ended[~final]
+            quarter[nxt] += 1
+            to_overtime = nxt[quarter[nxt] == 5]
+            overtime[to_overtime] = True
+            seconds[nxt] = np.where(quarter[nxt] == 5, rules["overtime_seconds"], rules["quarter_seconds"])
+            timeouts[nxt[quarter[nxt] == 3]] = rules["timeouts_per_half"]
+            timeouts[to_overtime] = rules["overtime_timeouts"]
+            kicker = np.where(quarter[nxt] % 2 == 1, opening_kicker[nxt], 3 - opening_kicker[nxt])
+            possession[nxt] = 3 - kicker
+            ball_on[nxt] = spot(possession[nxt], receive_spot)
+            down[nxt] = 1
+            yards_to_go[nxt] = 10
+
+    results = {
+        "team1_score": score[all_games, 1],
+        "team2_score": score[all_games, 2],
+        "overtime": overtime,
+        "game_seconds": elapsed,
+        "unfinished": active,
+    }
+    for key, values in stats.items():
+        results[f"team1_{key}"] = values[:, 1]
+        results[f"team2_{key}"] = values[:, 2]
+    return results
+
+
+def summarize(results):
+    team1 = results["team1_score"].astype(np.int32)
+    team2 = results["team2_score"].astype(np.int32)
+    total = team1 + team2
+    margin = np.abs(team1 - team2)
+    plays = results["team1_plays"] + results["team2_plays"]
+    return {
+        "games": int(team1.size),
+        "mean_points": float(total.mean()),
+        "points_p10_p50_p90": [int(v) for v in np.percentile(total, [10, 50, 90])],
+        "mean_margin": float(margin.mean()),
+        "team1_win_rate": float((team1 > team2).mean()),
+        "tie_rate": float((team1 == team2).mean()),
+        "overtime_rate": float(results["overtime"].mean()),
+        "mean_plays": float(plays.mean()),
+        "mean_game_minutes": float(results["game_seconds"].mean() / 60),
+        "touchdowns_per_game": float((results["team1_touchdowns"] + results["team2_touchdowns"]).mean()),
+        "turnovers_on_downs_per_game": float(
+            (results["team1_turnovers_on_downs"] + results["team2_turnovers_on_downs"]).mean()),
+    }
+
+
+def score_distribution(results, max_points=None):
+    total = results["team1_score"].astype(np.int32) + results["team2_score"]
+    counts = np.bincount(total, minlength=(max_points or 0) + 1)
+    return counts / counts.sum()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo electric football game simulator")
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quarter-minutes", type=int, default=DEFAULT_RULES["quarter_seconds"] // 60)
+    parser.add_argument("--play-seconds", type=int, default=DEFAULT_RULES["play_seconds"])
+    parser.add_argument("--timeouts", type=int, default=DEFAULT_RULES["timeouts_per_half"])
+    parser.add_argument("--overtime", action="store_true")
+    parser.add_argument("--sudden-death", action="store_true")
+    args = parser.parse_args()
+
+    rules = {
+        "quarter_seconds": args.quarter_minutes * 60,
+        "play_seconds": args.play_seconds,
+        "timeouts_per_half": args.timeouts,
+        "overtime": args.overtime or args.sudden_death,
+        "sudden_death": args.sudden_death,
+    }
+    start = time.perf_counter()
+    results = simulate_games(args.games, rules, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    for key, value in summarize(results).items():
+        print(f"{key:>28}: {value}")
+    print(f"{'seconds':>28}: {elapsed:.2f} ({args.games / elapsed:,.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
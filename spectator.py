@@ -0,0 +1,284 @@
+import json
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SPECTATOR_HOST = ""
+SPECTATOR_PORT = 8080
+MAX_WAIT_SECONDS = 60
+KEEPALIVE_SECONDS = 15
+EVENT_HISTORY = 2000
+# Game events streamed from /events, and the payload each one carries
+STREAMED_EVENTS = {
+    "log": lambda state, data: {"entry": state.box_score[-1], "index": len(state.box_score) - 1},
+    "log_clear": lambda state, data: {},
+    "score": lambda state, data: {"team": data["team"], "points": data["points"],
+                                  "team1_score": state.team1_score, "team2_score": state.team2_score},
+    "clock": lambda state, data: {"clock": state.game_clock.display(), "quarter": state.quarter},
+}
+# Changes that are not incremental; these stream a full "snapshot" event
+RESYNC_EVENTS = ("reset", "load", "restore")
+
+
+def spectator_state(state):
+    return {
+        "team1": {"name": state.team1_name, "score": state.team1_score},
+        "team2": {"name": state.team2_name, "score": state.team2_score},
+        "quarter": state.quarter,
+        "clock": state.game_clock.display(),
+        "clock_running": state.clock_running,
+        "down": state.down,
+        "yards_to_go": state.yards_to_go,
+        "ball_on": state.ball_on,
+        "field_position": state.format_yard_line(state.ball_on),
+        "possession": state.possession,
+    }
+
+
+def sse(seq, event, data):
+    return f"id: {seq}\nevent: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+class Snapshot:
+    # One published version of the game. Never modified after publish; the
+    # JSON body is serialized at most once, by whichever request needs it
+    # first, and then served as-is to every other request. event_seq is the
+    # last streamed event the snapshot already reflects.
+    def __init__(self, version, data, event_seq=0):
+        self.version = version
+        self.data = data
+        self.event_seq = event_seq
+        self.etag = f'"{version}"'
+        self.body_lock = threading.Lock()
+        self.encoded = None
+
+    def body(self, server):
+        with self.body_lock:
+            if self.encoded is None:
+                self.encoded = json.dumps(dict(self.data, version=self.version),
+                                          separators=(",", ":")).encode("utf-8")
+                server.serializations += 1
+        return self.encoded
+
+
+class SpectatorHandler(BaseHTTPRequestHandler):
+    # GET /state returns the latest snapshot. With If-None-Match set to the
+    # current ETag it answers 304, or with ?wait=N it first long-polls up to
+    # N seconds for a newer version. GET /log?since=N returns the box score
+    # lines from N on; the snapshot's log_version says when to ask again and
+    # a new log_generation that earlier lines changed too. GET /events is
+    # the server-sent event stream of play-by-play, score and clock changes.
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/events":
+            self.stream(url)
+            return
+        if url.path == "/log":
+            self.send_log(url)
+            return
+        if url.path != "/state":
+            self.send_error(404)
+            return
+        spectators = self.server.spectators
+        spectators.requests += 1
+        etag = self.headers.get("If-None-Match")
+        try:
+            wait = min(MAX_WAIT_SECONDS, float(parse_qs(url.query).get("wait", ["0"])[0]))
+        except ValueError:
+            wait = 0
+        snapshot = spectators.snapshot
+        if etag and wait > 0 and etag == snapshot.etag:
+            spectators.long_polls += 1
+            snapshot = spectators.wait_for_change(snapshot.version, wait)
+        if etag == snapshot.etag:
+            spectators.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", snapshot.etag)
+            self.end_headers()
+            return
+        self.send_json(snapshot.body(spectators), snapshot.etag)
+
+    def send_json(self, body, etag):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_log(self, url):
+        spectators = self.server.spectators
+        spectators.log_requests += 1
+        try:
+            since = max(0, int(parse_qs(url.query).get("since", ["0"])[0]))
+        except ValueError:
+            since = 0
+        log = spectators.log_since(since)
+        etag = f'"{log["generation"]}-{log["version"]}-{since}"'
+        if self.headers.get("If-None-Match") == etag:
+            spectators.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_json(json.dumps(log, separators=(",", ":")).encode("utf-8"), etag)
+
+    def stream(self, url):
+        # A client resuming with Last-Event-ID (or ?last_id=) is sent only
+        # the events after it; a new client, or one whose id has fallen out
+        # of the history, gets a "snapshot" event with the whole state first
+        spectators = self.server.spectators
+        spectators.streams += 1
+        last_id = self.headers.get("Last-Event-ID") or parse_qs(url.query).get("last_id", [None])[0]
+        try:
+            last = int(last_id) if last_id is not None else None
+        except ValueError:
+            last = None
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        try:
+            while True:
+                events = spectators.events_since(last) if last is not None else None
+                if events is None:
+                    snapshot = spectators.snapshot
+                    last = snapshot.event_seq
+                    data = dict(snapshot.data, version=snapshot.version, box_score=spectators.log_since(0)["entries"])
+                    self.wfile.write(sse(last, "snapshot", json.dumps(data, separators=(",", ":"))))
+                    spectators.resyncs += 1
+                    continue
+                if events:
+                    self.wfile.write(b"".join(data for _, data in events))
+                    spectators.events_sent += len(events)
+                    last = events[-1][0]
+                elif not spectators.wait_for_event(last, KEEPALIVE_SECONDS):
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            spectators.streams -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SpectatorServer:
+    # Read-only HTTP view of the game for phones in the room. The Tk thread
+    # publishes immutable snapshots; request threads only ever read the
+    # latest one, so serving never waits on the game loop. The box score is
+    # kept out of the snapshots, which change with every clock tick: the
+    # server keeps its own copy of the lines, appended to from the log
+    # events and only rebuilt when the log is cleared, replaced or undone.
+    def __init__(self, host=SPECTATOR_HOST, port=SPECTATOR_PORT):
+        self.changed = threading.Condition()
+        self.snapshot = Snapshot(0, {})
+        self.log = []
+        self.log_version = 0
+        self.log_generation = 0
+        self.log_requests = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.long_polls = 0
+        self.serializations = 0
+        self.events = deque(maxlen=EVENT_HISTORY)
+        self.event_seq = 0
+        self.streams = 0
+        self.events_sent = 0
+        self.resyncs = 0
+        self.httpd = ThreadingHTTPServer((host, port), SpectatorHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.spectators = self
+        self.address = self.httpd.server_address
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="spectators", daemon=True)
+        self.thread.start()
+
+    def attach(self, state):
+        self.state = state
+        state.subscribe(self.on_state_event)
+        self.rebuild_log()
+
+    def on_state_event(self, event, data):
+        if event == "log":
+            self.append_log(self.state.box_score[-1])
+        elif event == "log_clear" or event in RESYNC_EVENTS:
+            self.rebuild_log()
+        if event in STREAMED_EVENTS:
+            self.push_event(event, STREAMED_EVENTS[event](self.state, data))
+        elif event in RESYNC_EVENTS:
+            # Stream the whole state, and publish it right away so the
+            # /state snapshot already reflects the event
+            data = spectator_state(self.state)
+            self.push_event("snapshot", dict(data, box_score=list(self.log)))
+            self.publish(data)
+
+    def append_log(self, entry):
+        with self.changed:
+            self.log.append(entry)
+            self.log_version += 1
+
+    def rebuild_log(self):
+        entries = list(self.state.box_score)
+        with self.changed:
+            self.log = entries
+            self.log_version += 1
+            self.log_generation += 1
+
+    def log_since(self, since):
+        with self.changed:
+            return {"generation": self.log_generation, "version": self.log_version, "start": since,
+                    "length": len(self.log), "entries": self.log[since:]}
+
+    def publish(self, data):
+        with self.changed:
+            data = dict(data, log_version=self.log_version, log_generation=self.log_generation,
+                        log_length=len(self.log))
+        if data == self.snapshot.data:
+            return False
+        with self.changed:
+            self.snapshot = Snapshot(self.snapshot.version + 1, data, self.event_seq)
+            self.changed.notify_all()
+        return True
+
+    def push_event(self, event, data):
+        with self.changed:
+            self.event_seq += 1
+            self.events.append((self.event_seq, sse(self.event_seq, event, json.dumps(data, separators=(",", ":")))))
+            self.changed.notify_all()
+
+    def events_since(self, seq):
+        # None when seq is no longer covered by the history
+        with self.changed:
+            if seq > self.event_seq:
+                return None
+            if seq == self.event_seq:
+                return []
+            if not self.events or self.events[0][0] > seq + 1:
+                return None
+            start = seq + 1 - self.events[0][0]
+            return [self.events[i] for i in range(start, len(self.events))]
+
+    def wait_for_change(self, version, timeout):
+        with self.changed:
+            self.changed.wait_for(lambda: self.snapshot.version != version, timeout)
+            return self.snapshot
+
+    def wait_for_event(self, seq, timeout):
+        with self.changed:
+            return self.changed.wait_for(lambda: self.event_seq > seq, timeout)
+
+    def stats(self):
+        return {"address": "%s:%d" % self.address[:2], "version": self.snapshot.version,
+                "requests": self.requests, "log_requests": self.log_requests, "not_modified": self.not_modified,
+                "long_polls": self.long_polls, "serializations": self.serializations,
+                "event_seq": self.event_seq, "streams": self.streams, "events_sent": self.events_sent,
+                "resyncs": self.resyncs}
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
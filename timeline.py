@@ -0,0 +1,107 @@
+from play_log import PLAY, KICKOFF, BALL_MOVED, POSSESSION, SCORE, PENALTY, NOTE, quarter_label
+
+CHECKPOINT_EVERY = 32
+
+
+def copy_board(board):
+    return dict(board, team1_stats=dict(board["team1_stats"]), team2_stats=dict(board["team2_stats"]))
+
+
+def apply_record(board, record, play_types):
+    # The scoreboard after one PlayLog record, following the rule that wrote it
+    kind = record["kind"]
+    # Lines kept from text-only saves carry no game situation
+    if kind == NOTE:
+        return board
+    board["quarter"] = quarter_label(record["quarter"])
+    board["clock"] = record["clock"]
+    board["possession"] = record["possession"]
+    if record["team1_timeouts"] >= 0:
+        board["team1_timeouts"] = record["team1_timeouts"]
+        board["team2_timeouts"] = record["team2_timeouts"]
+    if kind == PLAY:
+        yards, end = record["yards"], record["end"]
+        touchdown = end in (0, 100)
+        stats = board[f"team{record['possession']}_stats"]
+        stats["total_yards"] += yards
+        play_type = play_types[record["play_type"]]
+        if play_type in ("pass", "rush"):
+            stats[f"{play_type}_yards"] += yards
+        board["ball_on"] = max(1, min(99, end))
+        # A touchdown or turnover is followed by a POSSESSION record
+        if not touchdown and not record["turnover"]:
+            board["yards_to_go"] -= yards
+            if board["yards_to_go"] <= 0:
+                board["down"], board["yards_to_go"] = 1, 10
+                stats["first_downs"] += 1
+            elif board["down"] < 4:
+                board["down"] += 1
+    elif kind in (KICKOFF, POSSESSION):
+        board["down"], board["yards_to_go"] = 1, 10
+        if record["end"] >= 0:
+            board["ball_on"] = record["end"]
+    elif kind == BALL_MOVED:
+        board["ball_on"] = record["end"]
+    elif kind == SCORE:
+        board[f"team{record['team']}_score"] += record["value"]
+    elif kind == PENALTY:
+        board[f"team{record['team']}_stats"]["penalties"] += 1
+        if record["end"] >= 0:
+            board["ball_on"] = record["end"]
+    return board
+
+
+class Timeline:
+    # The scoreboard as of any record of the live game's PlayLog. Every
+    # CHECKPOINT_EVERY records a copy of the scoreboard is kept, so a seek
+    # replays at most that many records from the checkpoint before it.
+    # Checkpoints remember the serial of the record they end on; undo, redo
+    # and clear only change the log's tail or replace the log, so stale
+    # checkpoints are dropped from the end when the next seek notices them.
+    def __init__(self, state, every=CHECKPOINT_EVERY):
+        self.state = state
+        self.every = every
+        self.plays = None
+        self.checkpoints = []
+        self.replayed = 0
+
+    def __len__(self):
+        return len(self.state.plays)
+
+    def opening(self):
+        plays = self.state.plays
+        return plays.opening if plays.opening is not None else self.state.scoreboard()
+
+    def validate(self):
+        plays = self.state.plays
+        if plays is not self.plays:
+            self.plays = plays
+            self.checkpoints = [(None, copy_board(self.opening()))]
+            return
+        while len(self.checkpoints) > 1:
+            index = (len(self.checkpoints) - 1) * self.every - 1
+            if index < len(plays) and plays.key(index) == self.checkpoints[-1][0]:
+                break
+            self.checkpoints.pop()
+
+    def replay(self, board, start, stop):
+        plays = self.state.plays
+        for index in range(start, stop):
+            apply_record(board, plays.record(index), plays.play_types)
+        self.replayed += stop - start
+        return board
+
+    def at(self, index):
+        # The scoreboard just after record index; -1 is before the first record
+        self.validate()
+        plays = self.state.plays
+        count = min(index + 1, len(plays))
+        wanted = count // self.every
+        while len(self.checkpoints) <= wanted:
+            done = (len(self.checkpoints) - 1) * self.every
+            board = self.replay(copy_board(self.checkpoints[-1][1]), done, done + self.every)
+            self.checkpoints.append((plays.key(done + self.every - 1), board))
+        return self.replay(copy_board(self.checkpoints[wanted][1]), wanted * self.every, count)
+
+    def stats(self):
+        return {"records": len(self), "checkpoints": len(self.checkpoints), "replayed": self.replayed}
@@ -0,0 +1,162 @@
+import heapq
+import itertools
+import time
+import traceback
+
+
+class Timer:
+    def __init__(self, timers, name, deadline, callback, interval):
+        self.timers = timers
+        self.name = name
+        self.deadline = deadline
+        self.callback = callback
+        self.interval = interval
+        self.paused_remaining = None
+        self.cancelled = False
+
+    @property
+    def paused(self):
+        return self.paused_remaining is not None
+
+    @property
+    def active(self):
+        return not self.cancelled
+
+    def remaining(self):
+        if self.paused:
+            return self.paused_remaining
+        return max(0.0, self.deadline - self.timers.now())
+
+    def cancel(self):
+        self.timers.cancel(self)
+
+    def pause(self):
+        self.timers.pause(self)
+
+    def resume(self):
+        self.timers.resume(self)
+
+
+class Timers:
+    # Every timed event in the app (clock display updates, the timeout
+    # countdown, the play timer and its vibration cue) is a named Timer here,
+    # run from one after() job armed for the earliest deadline. Scheduling a
+    # name that is already pending replaces it, so a second timeout or a
+    # reset can never leave a stale countdown behind.
+    def __init__(self, widget, now=time.monotonic):
+        self.widget = widget
+        self.now = now
+        self.timers = {}
+        self.heap = []
+        self.order = itertools.count()
+        self.job = None
+        self.job_deadline = None
+        self.fired = 0
+        self.errors = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def call_later(self, name, delay, callback, interval=None):
+        self.cancel(name)
+        timer = Timer(self, name, self.now() + delay, callback, interval)
+        self.timers[name] = timer
+        self.push(timer)
+        return timer
+
+    def get(self, name):
+        return self.timers.get(name)
+
+    def lookup(self, timer):
+        return self.timers.get(timer) if isinstance(timer, str) else timer
+
+    def cancel(self, timer):
+        timer = self.lookup(timer)
+        if timer is None or timer.cancelled:
+            return
+        timer.cancelled = True
+        if self.timers.get(timer.name) is timer:
+            del self.timers[timer.name]
+        self.rearm()
+
+    def pause(self, timer):
+        timer = self.lookup(timer)
+        if timer is None or timer.cancelled or timer.paused:
+            return
+        timer.paused_remaining = timer.remaining()
+        self.rearm()
+
+    def resume(self, timer):
+        timer = self.lookup(timer)
+        if timer is None or timer.cancelled or not timer.paused:
+            return
+        timer.deadline = self.now() + timer.paused_remaining
+        timer.paused_remaining = None
+        self.push(timer)
+
+    def cancel_all(self):
+        for timer in list(self.timers.values()):
+            self.cancel(timer)
+
+    def inspect(self):
+        return [{"name": timer.name, "remaining": timer.remaining(), "paused": timer.paused,
+                 "interval": timer.interval}
+                for timer in sorted(self.timers.values(), key=Timer.remaining)]
+
+    def push(self, timer):
+        heapq.heappush(self.heap, (timer.deadline, next(self.order), timer))
+        self.rearm()
+
+    def pending(self, entry):
+        deadline, _, timer = entry
+        return not timer.cancelled and not timer.paused and timer.deadline == deadline
+
+    def rearm(self):
+        # Drop stale heap entries (cancelled, paused or rescheduled timers),
+        # then make sure the after() job wakes for the earliest live deadline
+        while self.heap and not self.pending(self.heap[0]):
+            heapq.heappop(self.heap)
+        deadline = self.heap[0][0] if self.heap else None
+        if deadline == self.job_deadline:
+            return
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+        self.job_deadline = deadline
+        if deadline is not None:
+            delay_ms = max(0, int((deadline - self.now()) * 1000) + 1)
+            self.job = self.widget.after(delay_ms, self.run)
+
+    def run(self):
+        # A callback that raises is reported and the other timers keep
+        # running; rearm must always follow, or every timer stops
+        self.job = None
+        self.job_deadline = None
+        now = self.now()
+        try:
+            while self.heap and self.heap[0][0] <= now:
+                entry = heapq.heappop(self.heap)
+                if not self.pending(entry):
+                    continue
+                timer = entry[2]
+                lateness = now - timer.deadline
+                self.fired += 1
+                self.total_lateness += lateness
+                self.max_lateness = max(self.max_lateness, lateness)
+                if timer.interval:
+                    timer.deadline += timer.interval
+                    heapq.heappush(self.heap, (timer.deadline, next(self.order), timer))
+                else:
+                    timer.cancelled = True
+                    del self.timers[timer.name]
+                try:
+                    timer.callback()
+                except Exception:
+                    self.errors += 1
+                    traceback.print_exc()
+        finally:
+            self.rearm()
+
+    def stats(self):
+        return {"active": len(self.timers), "fired": self.fired, "errors": self.errors, "heap": len(self.heap),
+                "mean_lateness_ms": 1000 * self.total_lateness / self.fired if self.fired else 0.0,
+                "max_lateness_ms": 1000 * self.max_lateness}
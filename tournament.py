@@ -0,0 +1,257 @@
+import argparse
+import tkinter as tk
+from tkinter import ttk, simpledialog, messagebox
+
+from game_state import GameState, PLAY_TYPES
+from history import History
+from play_log_view import PlayLogView
+from timers import Timers
+from view_model import ViewModel
+
+DISPLAY_BG = "#006E33"
+HISTORY_LIMIT = 50
+# View fields each state event makes stale, as in the single-game app
+EVENT_FIELDS = {
+    "names": ("title", "scores"),
+    "score": ("title", "scores"),
+    "clock": ("clock",),
+    "play_clock": ("clock",),
+    "quarter": ("clock", "title"),
+    "ball": ("situation",),
+    "downs": ("situation",),
+    "possession": ("situation",),
+    "timeouts": ("situation",),
+    "game_over": ("title",),
+}
+
+
+class GameTab:
+    # One table of the tournament: its GameState, a compact control tab and
+    # an audience display window. Everything heavier is shared through the
+    # Tournament (one Timers scheduler, one idle render pass per game's
+    # ViewModel, no threads), so a game costs only its state and widgets.
+    def __init__(self, tournament, number, team1_name, team2_name, display=True):
+        self.tournament = tournament
+        self.number = number
+        self.clock_timer = f"clock-{number}"
+        self.final = False
+        self.state = GameState(team1_name, team2_name)
+        self.history = History(self.state, limit=HISTORY_LIMIT)
+        self.view = ViewModel(tournament.root)
+        self.frame = ttk.Frame(tournament.notebook, padding=10)
+        tournament.notebook.add(self.frame, text=self.title())
+        self.setup_controls()
+        self.display = self.setup_display() if display else None
+        self.bind_view()
+        self.state.subscribe(self.on_state_event)
+        self.view.mark_all()
+
+    def title(self):
+        state = self.state
+        status = "Final" if self.final else f"Q{state.quarter}"
+        return f"{self.number}: {state.team1_name} {state.team1_score}-{state.team2_score} {state.team2_name} ({status})"
+
+    def setup_controls(self):
+        frame = self.frame
+        self.score_label = ttk.Label(frame, font=("Arial", 28))
+        self.score_label.grid(row=0, column=0, columnspan=4, pady=5)
+        self.clock_label = ttk.Label(frame, font=("Arial", 20))
+        self.clock_label.grid(row=1, column=0, columnspan=4)
+        self.situation_label = ttk.Label(frame, font=("Arial", 14))
+        self.situation_label.grid(row=2, column=0, columnspan=4, pady=5)
+
+        clock_frame = ttk.Frame(frame)
+        clock_frame.grid(row=3, column=0, columnspan=4, pady=5)
+        for text, command in (("Start", self.state.start_clock), ("Pause", self.state.pause_clock),
+                              ("Play Clock", self.state.start_play_clock),
+                              ("Next Quarter", self.state.next_quarter),
+                              ("Undo", self.state.undo), ("Redo", self.state.redo)):
+            ttk.Button(clock_frame, text=text, command=command).pack(side="left", padx=2)
+
+        play_frame = ttk.Frame(frame)
+        play_frame.grid(row=4, column=0, columnspan=4, pady=5)
+        self.play_type = tk.StringVar(value="rush")
+        self.yards = tk.IntVar(value=0)
+        ttk.OptionMenu(play_frame, self.play_type, "rush", *PLAY_TYPES).pack(side="left", padx=2)
+        ttk.Spinbox(play_frame, from_=-99, to=99, width=5, textvariable=self.yards).pack(side="left", padx=2)
+        ttk.Button(play_frame, text="Play", command=self.submit_play).pack(side="left", padx=2)
+        ttk.Button(play_frame, text="Turnover", command=self.state.switch_possession).pack(side="left", padx=2)
+
+        for column, team in ((0, 1), (2, 2)):
+            team_frame = ttk.Frame(frame)
+            team_frame.grid(row=5, column=column, columnspan=2, padx=10, pady=5)
+            for text, points in (("TD", 6), ("FG", 3), ("XP", 1), ("2PT", 2)):
+                ttk.Button(team_frame, text=text, width=4,
+                           command=lambda t=team, p=points: self.state.add_score(t, p)).pack(side="left")
+            ttk.Button(team_frame, text="TO", width=4,
+                       command=lambda t=team: self.state.use_timeout(t)).pack(side="left")
+            ttk.Button(team_frame, text="Kick", width=5,
+                       command=lambda t=team: self.state.kickoff(t)).pack(side="left")
+
+        self.log_view = PlayLogView(frame, lambda: self.state.box_score, height=10, width=60,
+                                    font=("Arial", 10))
+        self.log_view.frame.grid(row=6, column=0, columnspan=4, pady=5)
+
+    def setup_display(self):
+        window = tk.Toplevel(self.tournament.root)
+        window.geometry("640x320")
+        window.configure(bg=DISPLAY_BG)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        style = {"bg": DISPLAY_BG, "fg": "white"}
+        self.display_clock = tk.Label(window, font=("Arial", 64), **style)
+        self.display_clock.pack(pady=10)
+        self.display_score = tk.Label(window, font=("Arial", 40), **style)
+        self.display_score.pack(pady=10)
+        self.display_situation = tk.Label(window, font=("Arial", 24), **style)
+        self.display_situation.pack(pady=10)
+        return window
+
+    def bind_view(self):
+        self.view.bind("title", self.render_title)
+        self.view.bind("scores", self.render_scores)
+        self.view.bind("clock", self.render_clock)
+        self.view.bind("situation", self.render_situation)
+        self.view.bind("log", self.log_view.reload)
+
+    def on_state_event(self, event, data):
+        self.view.mark(*EVENT_FIELDS.get(event, ()))
+        if event == "game_over":
+            self.final = True
+        elif event == "clock_state":
+            self.schedule_clock()
+        elif event == "log":
+            self.log_view.append()
+        elif event == "log_clear":
+            self.log_view.clear()
+        elif event in ("reset", "load", "restore"):
+            self.final = False
+            self.view.mark_all()
+
+    def render_title(self):
+        self.tournament.notebook.tab(self.frame, text=self.title())
+        if self.display:
+            self.display.title(f"Table {self.number} - {self.state.team1_name} vs {self.state.team2_name}")
+
+    def render_scores(self):
+        state = self.state
+        text = f"{state.team1_name} {state.team1_score}  -  {state.team2_score} {state.team2_name}"
+        self.view.set(self.score_label, text=text)
+        if self.display:
+            self.view.set(self.display_score, text=text)
+
+    def render_clock(self):
+        state = self.state
+        self.view.set(self.clock_label, text=f"Q{state.quarter}  {state.game_clock.display()}  "
+                                             f"Play: {state.play_clock.display()}")
+        if self.display:
+            self.view.set(self.display_clock, text=state.game_clock.display())
+
+    def render_situation(self):
+        state = self.state
+        text = (f"{state.down} & {state.yards_to_go} on {state.format_yard_line(state.ball_on)} - "
+                f"{state.team_name(state.possession)} ball")
+        self.view.set(self.situation_label, text=f"{text}  |  TO {state.team1_timeouts}-{state.team2_timeouts}")
+        if self.display:
+            self.view.set(self.display_situation, text=text)
+
+    def submit_play(self):
+        try:
+            yards = self.yards.get()
+        except tk.TclError:
+            return
+        self.state.process_play(self.play_type.get(), yards)
+
+    def schedule_clock(self):
+        timers = self.tournament.timers
+        delay = self.state.next_clock_delay()
+        if delay is None:
+            timers.cancel(self.clock_timer)
+            return
+        timers.call_later(self.clock_timer, delay + 0.001, self.update_clock)
+
+    def update_clock(self):
+        self.state.poll_clocks()
+        self.schedule_clock()
+
+    def close(self):
+        self.tournament.timers.cancel(self.clock_timer)
+        self.view.cancel()
+        self.state.unsubscribe(self.on_state_event)
+        self.tournament.notebook.forget(self.frame)
+        self.frame.destroy()
+        if self.display:
+            self.display.destroy()
+
+
+class Tournament:
+    # Hosts any number of independent games in one Tk process: one notebook
+    # tab and one display window per game, all clocks on a single Timers.
+    def __init__(self, root, displays=True):
+        self.root = root
+        self.displays = displays
+        self.root.title("Electric Football Scoreboard - Tournament")
+        self.root.geometry("900x700")
+        self.timers = Timers(root)
+        self.games = []
+        self.next_number = 1
+        menubar = tk.Menu(root)
+        root.config(menu=menubar)
+        game_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Games", menu=game_menu)
+        game_menu.add_command(label="Add Game", command=self.ask_add_game)
+        game_menu.add_command(label="Close Current Game", command=self.close_current)
+        game_menu.add_separator()
+        game_menu.add_command(label="Start All Clocks", command=lambda: self.each("start_clock"))
+        game_menu.add_command(label="Pause All Clocks", command=lambda: self.each("pause_clock"))
+        game_menu.add_command(label="Standings", command=self.show_standings)
+        self.notebook = ttk.Notebook(root)
+        self.notebook.pack(fill="both", expand=True)
+
+    def add_game(self, team1_name, team2_name):
+        game = GameTab(self, self.next_number, team1_name, team2_name, display=self.displays)
+        self.next_number += 1
+        self.games.append(game)
+        return game
+
+    def ask_add_game(self):
+        team1_name = simpledialog.askstring("New Game", "Team 1 name:", parent=self.root) or "Team 1"
+        team2_name = simpledialog.askstring("New Game", "Team 2 name:", parent=self.root) or "Team 2"
+        self.notebook.select(self.add_game(team1_name, team2_name).frame)
+
+    def current(self):
+        selected = self.notebook.select()
+        for game in self.games:
+            if str(game.frame) == selected:
+                return game
+        return None
+
+    def close_current(self):
+        game = self.current()
+        if game and messagebox.askyesno("Close Game", f"Close {game.title()}?"):
+            game.close()
+            self.games.remove(game)
+
+    def each(self, method):
+        for game in self.games:
+            getattr(game.state, method)()
+
+    def show_standings(self):
+        lines = [game.title() for game in self.games] or ["No games"]
+        messagebox.showinfo("Standings", "\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several scoreboard games in one window")
+    parser.add_argument("--games", type=int, default=2, help="games to open at start")
+    parser.add_argument("--no-displays", action="store_true", help="do not open display windows")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    tournament = Tournament(root, displays=not args.no_displays)
+    for number in range(1, args.games + 1):
+        tournament.add_game(f"Home {number}", f"Away {number}")
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+class ViewModel:
+    # Dirty-flag rendering: state events mark named fields dirty and one
+    # after_idle pass renders each dirty field once, in the order the fields
+    # were bound. Renderers configure widgets through set(), which skips
+    # options that already hold the requested value.
+    def __init__(self, widget):
+        self.widget = widget
+        self.renderers = {}
+        self.dirty = set()
+        self.job = None
+        self.widget_options = {}
+        self.marks = 0
+        self.coalesced = 0
+        self.renders = 0
+        self.flushes = 0
+        self.configures = 0
+        self.unchanged = 0
+
+    def bind(self, field, render):
+        self.renderers[field] = render
+
+    def fields(self):
+        return tuple(self.renderers)
+
+    def mark(self, *fields):
+        for field in fields:
+            self.marks += 1
+            if field in self.dirty:
+                self.coalesced += 1
+            else:
+                self.dirty.add(field)
+        if self.dirty and self.job is None:
+            self.job = self.widget.after_idle(self.flush)
+
+    def mark_all(self):
+        self.mark(*self.renderers)
+
+    def flush(self):
+        self.job = None
+        self.flushes += 1
+        dirty, self.dirty = self.dirty, set()
+        for field, render in self.renderers.items():
+            if field in dirty:
+                render()
+                self.renders += 1
+
+    def set(self, widget, **options):
+        current = self.widget_options.setdefault(str(widget), {})
+        changed = {key: value for key, value in options.items() if current.get(key) != value}
+        self.unchanged += len(options) - len(changed)
+        if changed:
+            widget.config(**changed)
+            current.update(changed)
+            self.configures += 1
+
+    def cancel(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def stats(self):
+        return {"marks": self.marks, "coalesced": self.coalesced, "renders": self.renders,
+                "flushes": self.flushes, "configures": self.configures, "unchanged": self.unchanged}
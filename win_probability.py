@@ -0,0 +1,188 @@
+import argparse
+import bisect
+import math
+import os
+import time
+
+import numpy as np
+
+from game_state import OVERTIME_SECONDS
+from simulator import DEFAULT_RULES, simulate_games
+
+WIN_PROBABILITY_TABLE = "win_probability.npz"
+# Table axes, all from the team with the ball's point of view:
+# score margin (clipped), period (4 quarters + OT), eighth of the period
+# left, down, distance (1-3, 4-7, 8+), ten-yard band to the goal, own and
+# opponent timeouts
+MARGIN_LIMIT = 24
+TIME_BINS = 8
+DISTANCE_EDGES = (4, 8)
+SHAPE = (2 * MARGIN_LIMIT + 1, 5, TIME_BINS, 4, len(DISTANCE_EDGES) + 1, 10, 4, 4)
+STRIDES = tuple(int(np.prod(SHAPE[axis + 1:])) for axis in range(len(SHAPE)))
+# Sparse cells lean on the same situation without down, distance and timeouts
+PRIOR_WEIGHT = 20
+BATCH_GAMES = 20000
+
+
+def clip(value, low, high):
+    return low if value < low else high if value > high else value
+
+
+def cell_index(margin, period, fraction, down, distance, to_goal, own_timeouts, opp_timeouts):
+    # Flat index into the table for arrays of snaps (table building)
+    coordinates = (
+        np.clip(margin, -MARGIN_LIMIT, MARGIN_LIMIT) + MARGIN_LIMIT,
+        np.clip(period, 1, 5) - 1,
+        np.clip(np.ceil(fraction * TIME_BINS) - 1, 0, TIME_BINS - 1).astype(np.int64),
+        np.clip(down, 1, 4) - 1,
+        np.searchsorted(DISTANCE_EDGES, distance, side="right"),
+        np.clip((to_goal - 1) // 10, 0, 9),
+        np.clip(own_timeouts, 0, 3),
+        np.clip(opp_timeouts, 0, 3),
+    )
+    return sum(np.asarray(value, dtype=np.int64) * stride for value, stride in zip(coordinates, STRIDES))
+
+
+def situation_index(margin, period, fraction, down, distance, to_goal, own_timeouts, opp_timeouts):
+    # cell_index for one situation in plain Python, for live lookups
+    coordinates = (
+        clip(margin, -MARGIN_LIMIT, MARGIN_LIMIT) + MARGIN_LIMIT,
+        clip(period, 1, 5) - 1,
+        clip(math.ceil(fraction * TIME_BINS) - 1, 0, TIME_BINS - 1),
+        clip(down, 1, 4) - 1,
+        bisect.bisect_right(DISTANCE_EDGES, distance),
+        clip((to_goal - 1) // 10, 0, 9),
+        clip(own_timeouts, 0, 3),
+        clip(opp_timeouts, 0, 3),
+    )
+    return sum(value * stride for value, stride in zip(coordinates, STRIDES))
+
+
+class Collector:
+    # Gathers (cell, game, team with the ball) for every simulated snap;
+    # the outcome is only known once the batch of games has finished
+    def __init__(self, rules):
+        self.rules = rules
+        self.cells = []
+        self.games = []
+        self.teams = []
+
+    def __call__(self, games, situation):
+        team = situation["possession"].astype(np.int64)
+        rows = np.arange(games.size)
+        score, timeouts = situation["score"], situation["timeouts"]
+        quarter = situation["quarter"]
+        length = np.where(quarter >= 5, self.rules["overtime_seconds"], self.rules["quarter_seconds"])
+        to_goal = np.where(team == 1, situation["ball_on"], 100 - situation["ball_on"])
+        self.cells.append(cell_index(
+            score[rows, team].astype(np.int64) - score[rows, 3 - team], quarter,
+            situation["seconds"] / length, situation["down"], situation["yards_to_go"], to_goal,
+            timeouts[rows, team], timeouts[rows, 3 - team]))
+        self.games.append(games.copy())
+        self.teams.append(team)
+
+    def outcomes(self, results):
+        games, teams = np.concatenate(self.games), np.concatenate(self.teams)
+        team1, team2 = results["team1_score"][games], results["team2_score"][games]
+        won = np.where(teams == 1, team1 > team2, team2 > team1)
+        # A tie counts as half a win for each side
+        return np.concatenate(self.cells), np.where(team1 == team2, 0.5, won.astype(float))
+
+
+def smooth(wins, snaps, prior):
+    return (wins + PRIOR_WEIGHT * prior) / (snaps + PRIOR_WEIGHT)
+
+
+def margin_prior(wins, snaps):
+    # Margins the simulator never produced (it scores in sevens) are
+    # interpolated from the nearest margins it did, per period and time bin
+    prior = np.full(wins.shape, 0.5)
+    margins = np.arange(wins.shape[0])
+    for period in range(wins.shape[1]):
+        for time_bin in range(wins.shape[2]):
+            seen = snaps[:, period, time_bin] > 0
+            if seen.any():
+                rates = wins[seen, period, time_bin] / snaps[seen, period, time_bin]
+                prior[:, period, time_bin] = np.interp(margins, margins[seen], rates)
+    return prior
+
+
+def build_table(games, rules=None, seed=None, batch_games=BATCH_GAMES):
+    rules = dict(DEFAULT_RULES, **(rules or {}))
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(int(np.prod(SHAPE)))
+    snaps = np.zeros(int(np.prod(SHAPE)))
+    for start in range(0, games, batch_games):
+        collector = Collector(rules)
+        results = simulate_games(min(batch_games, games - start), rules, rng=rng, observe=collector)
+        cells, outcome = collector.outcomes(results)
+        wins += np.bincount(cells, weights=outcome, minlength=wins.size)
+        snaps += np.bincount(cells, minlength=snaps.size)
+    # Fill sparse cells from coarser tables: margin/period/time, then with the field band
+    wins, snaps = wins.reshape(SHAPE), snaps.reshape(SHAPE)
+    situation_axes = (3, 4, 5, 6, 7)
+    coarse_wins, coarse_snaps = wins.sum(situation_axes), snaps.sum(situation_axes)
+    coarse = smooth(coarse_wins, coarse_snaps, margin_prior(coarse_wins, coarse_snaps))
+    field_axes = (3, 4, 6, 7)
+    field = smooth(wins.sum(field_axes), snaps.sum(field_axes), coarse[..., None])
+    probability = smooth(wins, snaps, field[:, :, :, None, None, :, None, None])
+    table = np.round(probability * 255).astype(np.uint8)
+    return table, int(snaps.sum())
+
+
+class WinProbability:
+    # O(1) live lookups: a few integer operations and one read from the
+    # precomputed table, which is stored as one byte per cell
+    def __init__(self, table):
+        self.table = table.reshape(-1)
+
+    @classmethod
+    def load(cls, path=WIN_PROBABILITY_TABLE):
+        with np.load(path) as data:
+            return cls(data["table"])
+
+    @classmethod
+    def load_if_present(cls, path=WIN_PROBABILITY_TABLE):
+        return cls.load(path) if os.path.exists(path) else None
+
+    def lookup(self, margin, period, fraction, down, distance, to_goal, own_timeouts, opp_timeouts):
+        index = situation_index(margin, period, fraction, down, distance, to_goal, own_timeouts, opp_timeouts)
+        return int(self.table[index]) / 255
+
+    def for_state(self, state):
+        # Probability that team 1 wins
+        team = state.possession
+        other = state.other_team(team)
+        overtime = state.quarter == "OT"
+        length = OVERTIME_SECONDS if overtime else state.quarter_seconds
+        to_goal = state.ball_on if team == 1 else 100 - state.ball_on
+        probability = self.lookup(state.score_for(team) - state.score_for(other), 5 if overtime else state.quarter,
+                                  state.game_clock.remaining() / length, state.down, state.yards_to_go, to_goal,
+                                  state.timeouts_for(team), state.timeouts_for(other))
+        return probability if team == 1 else 1 - probability
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute the win probability table from simulated games")
+    parser.add_argument("--games", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=WIN_PROBABILITY_TABLE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    table, snaps = build_table(args.games, seed=args.seed)
+    elapsed = time.perf_counter() - started
+    np.savez_compressed(args.out, table=table)
+    print(f"{args.games} games, {snaps:,} snaps in {elapsed:.1f} s")
+    print(f"{table.size:,} cells -> {args.out} ({os.path.getsize(args.out) / 1024:.0f} KiB)")
+
+    model = WinProbability(table)
+    started = time.perf_counter()
+    lookups = 100000
+    for _ in range(lookups):
+        model.lookup(3, 4, 0.2, 3, 5, 30, 2, 1)
+    print(f"lookup: {1e6 * (time.perf_counter() - started) / lookups:.1f} us")
+
+
+if __name__ == "__main__":
+    main()